@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from pathlib import Path
-from typing import Any
+from functools import cache
+from importlib import resources
+from typing import Any, AsyncGenerator
+
+from pydantic_core import to_json
 
 from sec_llm.compute import ALL_TOOL_NAMES
 from sec_llm.models import (
@@ -14,18 +17,28 @@ from sec_llm.models import (
     ComputationError,
     ExecutionPlan,
     LLMError,
+    SummaryBatch,
     UserQuery,
 )
 
 logger = logging.getLogger(__name__)
 
-_PROMPTS_DIR = Path(__file__).parent / "prompts"
+_CONFIDENCE_THRESHOLD = 0.85
 
-_CLARIFICATION_PROMPT = (_PROMPTS_DIR / "clarification_system.txt").read_text()
-_PLANNER_PROMPT = (_PROMPTS_DIR / "planner_system.txt").read_text()
-_SUMMARIZER_PROMPT = (_PROMPTS_DIR / "summarizer_system.txt").read_text()
+# Max sub-summaries packed into one summarizer call; larger batches are split
+# and the chunks run concurrently, since prompt growth eats the batching win.
+_MAX_SUMMARY_BATCH = 8
 
-_CONFIDENCE_THRESHOLD = 0.85
+_BATCH_INSTRUCTIONS = (
+    "Produce one summary per numbered item below, following the same rules as for "
+    "a single query. Return every item's id with its summary."
+)
+
+
+@cache
+def _load_prompt(name: str) -> str:
+    """Read a system prompt shipped in the sec_llm/prompts directory (once per name)."""
+    return (resources.files("sec_llm") / "prompts" / name).read_text(encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -45,14 +58,13 @@ class ClarificationAgentImpl:
     async def _llm_clarify(self, query: UserQuery) -> ClarificationResponse:
         """Use OpenAI structured output to clarify the query."""
         try:
-            messages: list[dict[str, str]] = [{"role": "system", "content": _CLARIFICATION_PROMPT}]
+            messages: list[dict[str, str]] = [
+                {"role": "system", "content": _load_prompt("clarification_system.txt")},
+                *query.conversation_history,
+                {"role": "user", "content": query.message},
+            ]
 
-            for entry in query.conversation_history:
-                messages.append(entry)
-
-            messages.append({"role": "user", "content": query.message})
-
-            response = self._client.beta.chat.completions.parse(
+            response = await self._client.beta.chat.completions.parse(
                 model=self._model,
                 messages=messages,
                 response_format=ClarificationResponse,
@@ -94,18 +106,20 @@ class PlannerAgentImpl:
     async def _llm_plan(self, query: ClarifiedQuery) -> ExecutionPlan:
         """Use OpenAI structured output to generate an execution plan."""
         try:
-            user_content = (
-                f"Ticker: {query.ticker}\n"
-                f"Query type: {query.query_type.value}\n"
-                f"Metrics: {[m.value for m in query.metrics]}\n"
-                f"Periods: {[p.model_dump() for p in query.periods]}\n"
-                f"Original: {query.original_message}"
-            )
-
-            response = self._client.beta.chat.completions.parse(
+            metrics = [m.value for m in query.metrics]
+            periods = [p.model_dump() for p in query.periods]
+            user_content = "\n".join((
+                f"Ticker: {query.ticker}",
+                f"Query type: {query.query_type.value}",
+                f"Metrics: {metrics}",
+                f"Periods: {periods}",
+                f"Original: {query.original_message}",
+            ))
+
+            response = await self._client.beta.chat.completions.parse(
                 model=self._model,
                 messages=[
-                    {"role": "system", "content": _PLANNER_PROMPT},
+                    {"role": "system", "content": _load_prompt("planner_system.txt")},
                     {"role": "user", "content": user_content},
                 ],
                 response_format=ExecutionPlan,
@@ -146,6 +160,46 @@ class SummarizerAgentImpl:
     ) -> str:
         return await self._llm_summarize(query, raw_data, computations)
 
+    async def summarize_batch(
+        self,
+        items: list[tuple[ClarifiedQuery, list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> list[str]:
+        """Summarize several independent results, returned in input order.
+
+        Up to _MAX_SUMMARY_BATCH items share a single LLM call; beyond that the
+        items are chunked and the chunks are summarized concurrently.
+        """
+        chunks = [
+            items[i:i + _MAX_SUMMARY_BATCH] for i in range(0, len(items), _MAX_SUMMARY_BATCH)
+        ]
+        summaries = await asyncio.gather(*(self._llm_summarize_batch(c) for c in chunks))
+        return [summary for chunk in summaries for summary in chunk]
+
+    async def stream_summarize(
+        self,
+        query: ClarifiedQuery,
+        raw_data: list[dict[str, Any]],
+        computations: list[dict[str, Any]],
+    ) -> AsyncGenerator[str, None]:
+        """Stream the summary text as the LLM generates it.
+
+        The upstream response is closed when the stream ends, fails, or the
+        consumer stops early (aclose), so it doesn't linger in the pool.
+        """
+        try:
+            stream = await self._client.chat.completions.create(
+                model=self._model,
+                messages=_summary_messages(_summary_request(query, raw_data, computations)),
+                temperature=0.3,
+                stream=True,
+            )
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        except Exception as exc:
+            raise LLMError(f"Summarizer agent failed: {exc}") from exc
+
     async def _llm_summarize(
         self,
         query: ClarifiedQuery,
@@ -154,24 +208,75 @@ class SummarizerAgentImpl:
     ) -> str:
         """Use OpenAI to generate a natural language summary."""
         try:
-            user_content = (
-                f"Query: {query.original_message}\n"
-                f"Ticker: {query.ticker}\n"
-                f"Metrics: {[m.value for m in query.metrics]}\n\n"
-                f"Raw data:\n{json.dumps(raw_data, indent=2, default=str)}\n\n"
-                f"Computations:\n{json.dumps(computations, indent=2, default=str)}"
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=_summary_messages(_summary_request(query, raw_data, computations)),
+                temperature=0.3,
+            )
+
+            return response.choices[0].message.content or ""
+        except Exception as exc:
+            raise LLMError(f"Summarizer agent failed: {exc}") from exc
+
+    async def _llm_summarize_batch(
+        self,
+        items: list[tuple[ClarifiedQuery, list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> list[str]:
+        """Use OpenAI structured output to summarize several items in one call."""
+        if len(items) == 1:
+            return [await self._llm_summarize(*items[0])]
+
+        try:
+            user_content = "\n\n".join(
+                [_BATCH_INSTRUCTIONS]
+                + [f"[{i}] {_summary_request(*item)}" for i, item in enumerate(items, start=1)]
             )
 
-            response = self._client.chat.completions.create(
+            response = await self._client.beta.chat.completions.parse(
                 model=self._model,
-                messages=[
-                    {"role": "system", "content": _SUMMARIZER_PROMPT},
-                    {"role": "user", "content": user_content},
-                ],
+                messages=_summary_messages(user_content),
+                response_format=SummaryBatch,
                 temperature=0.3,
             )
 
-            return response.choices[0].message.content or ""
+            batch = response.choices[0].message.parsed
+            if batch is None:
+                raise LLMError("LLM returned empty summary batch")
+
+            by_id = {item.id: item.summary for item in batch.summaries}
+            missing = [i for i in range(1, len(items) + 1) if i not in by_id]
+            if missing:
+                raise LLMError(f"LLM summary batch is missing items: {missing}")
+
+            return [by_id[i] for i in range(1, len(items) + 1)]
+        except LLMError:
+            raise
         except Exception as exc:
             raise LLMError(f"Summarizer agent failed: {exc}") from exc
 
+
+def _compact_json(value: Any) -> str:
+    """Minified JSON for prompts: the LLM doesn't need indentation, and it costs tokens."""
+    return to_json(value, fallback=str).decode()
+
+
+def _summary_messages(user_content: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": _load_prompt("summarizer_system.txt")},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _summary_request(
+    query: ClarifiedQuery,
+    raw_data: list[dict[str, Any]],
+    computations: list[dict[str, Any]],
+) -> str:
+    """Build the summarizer user message for one query's results."""
+    return (
+        f"Query: {query.original_message}\n"
+        f"Ticker: {query.ticker}\n"
+        f"Metrics: {[m.value for m in query.metrics]}\n\n"
+        f"Raw data:\n{_compact_json(raw_data)}\n\n"
+        f"Computations:\n{_compact_json(computations)}"
+    )
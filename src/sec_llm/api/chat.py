@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
+from collections import deque
+from typing import AsyncGenerator, AsyncIterator
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from sec_llm.dependencies import get_pipeline, get_settings
 from sec_llm.guardrails import check_scope, sanitize_input
@@ -15,29 +20,76 @@ from sec_llm.models import (
     FilingNotFoundError,
     LLMError,
     MetricNotAvailableError,
+    SECLLMError,
     UserQuery,
 )
 
 router = APIRouter()
 
-# Simple per-IP rate limiting state
-_rate_state: dict[str, list[float]] = {}
+# Simple per-IP rate limiting state: request timestamps, oldest first
+_rate_state: dict[str, deque[float]] = {}
+
+_RATE_WINDOW_SECONDS = 60.0
 
 
 def _check_rate_limit(ip: str, max_per_minute: int) -> None:
     now = time.monotonic()
-    window_start = now - 60.0
-    hits = _rate_state.get(ip, [])
-    hits = [t for t in hits if t > window_start]
+    window_start = now - _RATE_WINDOW_SECONDS
+    hits = _rate_state.get(ip)
+    if hits is None:
+        hits = _rate_state[ip] = deque()
+    while hits and hits[0] <= window_start:
+        hits.popleft()
     if len(hits) >= max_per_minute:
         raise HTTPException(status_code=429, detail="Rate limit exceeded. Try again shortly.")
     hits.append(now)
-    _rate_state[ip] = hits
 
 
-@router.post("/api/chat", response_model=AnalysisResponse)
-async def chat(query: UserQuery, request: Request) -> AnalysisResponse:
-    """Process a natural language financial query."""
+def prune_rate_state() -> None:
+    """Drop expired timestamps and forget IPs with no hits in the current window."""
+    window_start = time.monotonic() - _RATE_WINDOW_SECONDS
+    for ip in list(_rate_state):
+        hits = _rate_state[ip]
+        while hits and hits[0] <= window_start:
+            hits.popleft()
+        if not hits:
+            del _rate_state[ip]
+
+
+async def prune_rate_state_periodically() -> None:
+    """Background task: prune the rate-limit state once per window."""
+    while True:
+        await asyncio.sleep(_RATE_WINDOW_SECONDS)
+        prune_rate_state()
+
+
+# Pipeline errors that map to a client-facing HTTP status
+_PIPELINE_ERRORS: tuple[type[SECLLMError], ...] = (
+    CompanyNotFoundError,
+    FilingNotFoundError,
+    MetricNotAvailableError,
+    ComputationError,
+    LLMError,
+)
+
+
+def _http_error(exc: SECLLMError) -> HTTPException:
+    """Map a pipeline error to the HTTP status the API reports for it."""
+    if isinstance(exc, (CompanyNotFoundError, FilingNotFoundError)):
+        return HTTPException(status_code=404, detail=str(exc))
+    if isinstance(exc, (MetricNotAvailableError, ComputationError)):
+        return HTTPException(status_code=422, detail=str(exc))
+    if isinstance(exc, LLMError):
+        return HTTPException(status_code=502, detail=str(exc))
+    return HTTPException(status_code=500, detail=str(exc))
+
+
+def _guard_request(query: UserQuery, request: Request) -> UserQuery:
+    """Apply rate limiting, sanitization, and scope checks shared by chat endpoints.
+
+    Returns the query with its message sanitized, so the pipeline works on
+    exactly the text that passed the scope check.
+    """
     settings = get_settings()
 
     # Rate limiting
@@ -50,17 +102,74 @@ async def chat(query: UserQuery, request: Request) -> AnalysisResponse:
     if scope_error:
         raise HTTPException(status_code=422, detail=scope_error)
 
+    return query.model_copy(update={"message": sanitized})
+
+
+@router.post(
+    "/api/chat",
+    response_class=Response,
+    responses={200: {"model": AnalysisResponse}},
+)
+async def chat(query: UserQuery, request: Request) -> Response:
+    """Process a natural language financial query.
+
+    The pipeline already returns a validated AnalysisResponse, so it is
+    serialized straight to JSON instead of going through response_model.
+    """
+    query = _guard_request(query, request)
+    pipeline = get_pipeline()
+
+    try:
+        result = await pipeline.process(query)
+    except _PIPELINE_ERRORS as exc:
+        raise _http_error(exc)
+
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@router.post("/api/chat/stream", response_class=StreamingResponse)
+async def chat_stream(query: UserQuery, request: Request) -> StreamingResponse:
+    """Process a query and stream the summary as Server-Sent Events.
+
+    Events: ``data`` (structured results, no summary yet), ``delta`` (a JSON
+    string chunk of the summary), ``response`` (the final AnalysisResponse,
+    also the only event when clarification is needed), and ``error`` if the
+    summarizer fails mid-stream. Errors before the first event are returned
+    as regular HTTP errors, same as /api/chat.
+    """
+    query = _guard_request(query, request)
     pipeline = get_pipeline()
 
+    events = pipeline.process_stream(query)
+    try:
+        first = await anext(events)
+    except _PIPELINE_ERRORS as exc:
+        raise _http_error(exc)
+
+    return StreamingResponse(_sse_events(first, events), media_type="text/event-stream")
+
+
+async def _sse_events(
+    first: tuple[str, AnalysisResponse | str],
+    events: AsyncGenerator[tuple[str, AnalysisResponse | str], None],
+) -> AsyncIterator[str]:
     try:
-        return await pipeline.process(query)
-    except CompanyNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc))
-    except FilingNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc))
-    except MetricNotAvailableError as exc:
-        raise HTTPException(status_code=422, detail=str(exc))
-    except ComputationError as exc:
-        raise HTTPException(status_code=422, detail=str(exc))
-    except LLMError as exc:
-        raise HTTPException(status_code=502, detail=str(exc))
+        yield _sse(*first)
+        async for event in events:
+            yield _sse(*event)
+    except SECLLMError as exc:
+        error = _http_error(exc)
+        yield _sse("error", json.dumps({"status": error.status_code, "detail": error.detail}))
+    finally:
+        # On client disconnect, tear down the pipeline and its upstream LLM stream
+        await events.aclose()
+
+
+def _sse(event: str, payload: AnalysisResponse | str) -> str:
+    if isinstance(payload, AnalysisResponse):
+        data = payload.model_dump_json()
+    elif event == "delta":
+        data = json.dumps(payload)
+    else:
+        data = payload
+    return f"event: {event}\ndata: {data}\n\n"
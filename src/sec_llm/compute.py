@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable
 
 from sec_llm.models import (
@@ -11,7 +12,15 @@ from sec_llm.models import (
     MarginResult,
 )
 
+# Human-readable formula templates shown alongside each computation
+_GROWTH_FORMULA = "({current:,.2f} - {previous:,.2f}) / {previous:,.2f} = {pct:.2f}%"
+_MARGIN_FORMULA = "{numerator:,.2f} / {revenue:,.2f} = {pct:.2f}%"
+_SUM_FORMULA = "{terms} = {result:,.2f}"
+_AVERAGE_FORMULA = "({terms}) / {count} = {result:,.2f}"
+_TERM_FORMAT = "{:,.2f}".format
 
+
+@lru_cache(maxsize=1024)
 def compute_growth(
     metric_name: str,
     current_value: float,
@@ -19,13 +28,18 @@ def compute_growth(
     current_period: str,
     previous_period: str,
 ) -> GrowthResult:
-    """Compute growth rate between two periods."""
+    """Compute growth rate between two periods.
+
+    Memoized: plans often repeat the same computation, and the result model
+    is frozen so cached instances can be shared safely.
+    """
     if previous_value == 0:
         raise ComputationError(
             f"Cannot compute growth for {metric_name}: "
             f"previous period value is zero ({previous_period})"
         )
     growth_rate = (current_value - previous_value) / previous_value
+    pct = growth_rate * 100
     return GrowthResult(
         metric_name=metric_name,
         current_value=current_value,
@@ -33,31 +47,33 @@ def compute_growth(
         current_period=current_period,
         previous_period=previous_period,
         growth_rate=round(growth_rate, 6),
-        growth_percentage=round(growth_rate * 100, 2),
-        formula=f"({current_value:,.2f} - {previous_value:,.2f}) / {previous_value:,.2f} = {growth_rate * 100:.2f}%",
+        growth_percentage=round(pct, 2),
+        formula=_GROWTH_FORMULA.format(current=current_value, previous=previous_value, pct=pct),
     )
 
 
+@lru_cache(maxsize=1024)
 def compute_margin(
     metric_name: str,
     numerator: float,
     revenue: float,
     period: str,
 ) -> MarginResult:
-    """Compute a margin ratio (numerator / revenue)."""
+    """Compute a margin ratio (numerator / revenue). Memoized like compute_growth."""
     if revenue == 0:
         raise ComputationError(
             f"Cannot compute margin for {metric_name}: revenue is zero ({period})"
         )
     margin_rate = numerator / revenue
+    pct = margin_rate * 100
     return MarginResult(
         metric_name=metric_name,
         numerator=numerator,
         revenue=revenue,
         period=period,
         margin_rate=round(margin_rate, 6),
-        margin_percentage=round(margin_rate * 100, 2),
-        formula=f"{numerator:,.2f} / {revenue:,.2f} = {margin_rate * 100:.2f}%",
+        margin_percentage=round(pct, 2),
+        formula=_MARGIN_FORMULA.format(numerator=numerator, revenue=revenue, pct=pct),
     )
 
 
@@ -73,19 +89,23 @@ def aggregate_quarters(
     if not quarter_data:
         raise ComputationError(f"No quarter data provided for aggregation of {metric_name}")
 
-    values = [d["value"] for d in quarter_data]
-    periods = [str(d["period"]) for d in quarter_data]
+    if method not in ("sum", "average"):
+        raise ComputationError(f"Unknown aggregation method: {method}")
 
+    values: list[float] = []
+    periods: list[str] = []
+    for d in quarter_data:
+        values.append(d["value"])
+        periods.append(str(d["period"]))
+
+    total = sum(values)
+    terms = " + ".join(map(_TERM_FORMAT, values))
     if method == "sum":
-        result = sum(values)
-        formula = " + ".join(f"{v:,.2f}" for v in values) + f" = {result:,.2f}"
-    elif method == "average":
-        result = sum(values) / len(values)
-        formula = (
-            "(" + " + ".join(f"{v:,.2f}" for v in values) + f") / {len(values)} = {result:,.2f}"
-        )
+        result = total
+        formula = _SUM_FORMULA.format(terms=terms, result=result)
     else:
-        raise ComputationError(f"Unknown aggregation method: {method}")
+        result = total / len(values)
+        formula = _AVERAGE_FORMULA.format(terms=terms, count=len(values), result=result)
 
     return AggregationResult(
         metric_name=metric_name,
@@ -15,5 +15,9 @@ class Settings(BaseSettings):
 
     cors_origins: list[str] = ["http://localhost:3000"]
     sec_cache_ttl_seconds: int = 900  # 15 minutes
+    sec_disk_cache_dir: str | None = None  # e.g. ".cache/sec" to enable
+    sec_disk_cache_ttl_seconds: int = 90 * 24 * 3600  # 90 days
+    edgar_max_concurrency: int = 8  # concurrent filing fetches per plan
+    edgar_max_workers: int = 8  # edgartools threads, shared by all requests
 
     rate_limit_per_minute: int = 20
@@ -20,15 +20,35 @@ def get_edgar_client() -> EdgarClient:
     return EdgarClient(
         identity=settings.edgar_identity,
         cache_ttl=settings.sec_cache_ttl_seconds,
+        disk_cache_dir=settings.sec_disk_cache_dir,
+        disk_cache_ttl=settings.sec_disk_cache_ttl_seconds,
+        max_workers=settings.edgar_max_workers,
     )
 
 
+async def close_edgar_client() -> None:
+    """Shut down the EDGAR client's thread pool and drop everything built on it."""
+    if get_edgar_client.cache_info().currsize:
+        await get_edgar_client().aclose()
+    get_edgar_client.cache_clear()
+    get_pipeline.cache_clear()
+
+
+@lru_cache
 def get_openai_client():
-    """Get a configured OpenAI client."""
-    from openai import OpenAI
+    """Process-wide async OpenAI client, shared by all agents."""
+    from openai import AsyncOpenAI
 
     settings = get_settings()
-    return OpenAI(api_key=settings.openai_api_key)
+    return AsyncOpenAI(api_key=settings.openai_api_key)
+
+
+async def close_openai_client() -> None:
+    """Close the OpenAI client's connections and drop everything built on it."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+    get_openai_client.cache_clear()
+    get_pipeline.cache_clear()
 
 
 @lru_cache
@@ -36,7 +56,10 @@ def get_pipeline() -> QueryPipeline:
     """Build the full query pipeline with all agents wired up."""
     settings = get_settings()
     edgar_client = get_edgar_client()
-    executor = ExecutionPlanExecutor(edgar_client)
+    executor = ExecutionPlanExecutor(
+        edgar_client,
+        max_concurrency=settings.edgar_max_concurrency,
+    )
 
     from sec_llm.agents import ClarificationAgentImpl, PlannerAgentImpl, SummarizerAgentImpl
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from sec_llm.models import (
     AggregationResult,
@@ -14,6 +14,12 @@ from sec_llm.models import (
     VisualizationPayload,
 )
 
+# Step outputs are dispatched on their exact type: a dict lookup on type(output)
+# is cheaper than a chain of isinstance checks against pydantic models.
+_RowHandler = Callable[[Any, str], list[dict[str, Any]]]
+
+_COMPUTATION_TYPES = frozenset({GrowthResult, MarginResult, AggregationResult})
+
 
 def format_visualization(
     query_type: QueryType,
@@ -21,70 +27,67 @@ def format_visualization(
     step_results: list[dict[str, Any]],
 ) -> VisualizationPayload | None:
     """Build a VisualizationPayload from execution results."""
-    if query_type == QueryType.direct_retrieval:
-        return _format_single_value(metric, step_results)
-    elif query_type == QueryType.growth_comparison:
-        return _format_comparison(metric, step_results)
-    elif query_type == QueryType.time_series:
-        return _format_timeseries(metric, step_results)
-    return None
-
-
-def _format_single_value(
-    metric: str, step_results: list[dict[str, Any]]
-) -> VisualizationPayload | None:
-    data = []
-    for result in step_results:
-        output = result.get("output")
-        if isinstance(output, IncomeStatementData):
-            value = output.get_metric(metric)
-            if value is not None:
-                data.append({"period": output.period_label, "value": value})
-    if not data:
+    chart = _CHARTS.get(query_type)
+    if chart is None:
         return None
-    return VisualizationPayload(chart_type="single_value", metric=metric, data=data)
-
-
-def _format_comparison(
-    metric: str, step_results: list[dict[str, Any]]
-) -> VisualizationPayload | None:
-    data = []
+    chart_type, handlers = chart
+    data: list[dict[str, Any]] = []
     for result in step_results:
         output = result.get("output")
-        if isinstance(output, GrowthResult):
-            data.append({
-                "period": output.current_period,
-                "value": output.current_value,
-                "previous_period": output.previous_period,
-                "previous_value": output.previous_value,
-                "growth_percentage": output.growth_percentage,
-                "formula": output.formula,
-            })
-        elif isinstance(output, IncomeStatementData):
-            value = output.get_metric(metric)
-            if value is not None:
-                data.append({"period": output.period_label, "value": value})
-    if not data:
-        return None
-    return VisualizationPayload(chart_type="comparison", metric=metric, data=data)
-
-
-def _format_timeseries(
-    metric: str, step_results: list[dict[str, Any]]
+        handler = handlers.get(type(output))
+        if handler is not None:
+            data.extend(handler(output, metric))
+    return _visualization(chart_type, metric, data)
+
+
+def _metric_rows(output: IncomeStatementData, metric: str) -> list[dict[str, Any]]:
+    value = output.get_metric(metric)
+    if value is None:
+        return []
+    return [{"period": output.period_label, "value": value}]
+
+
+def _growth_rows(output: GrowthResult, metric: str) -> list[dict[str, Any]]:
+    return [{
+        "period": output.current_period,
+        "value": output.current_value,
+        "previous_period": output.previous_period,
+        "previous_value": output.previous_value,
+        "growth_percentage": output.growth_percentage,
+        "formula": output.formula,
+    }]
+
+
+def _aggregation_rows(output: AggregationResult, metric: str) -> list[dict[str, Any]]:
+    return [
+        {"period": period, "value": value}
+        for period, value in zip(output.periods, output.values)
+    ]
+
+
+# Query type → (chart type, row handler per step output type)
+_CHARTS: dict[QueryType, tuple[str, dict[type, _RowHandler]]] = {
+    QueryType.direct_retrieval: (
+        "single_value",
+        {IncomeStatementData: _metric_rows},
+    ),
+    QueryType.growth_comparison: (
+        "comparison",
+        {GrowthResult: _growth_rows, IncomeStatementData: _metric_rows},
+    ),
+    QueryType.time_series: (
+        "timeseries",
+        {IncomeStatementData: _metric_rows, AggregationResult: _aggregation_rows},
+    ),
+}
+
+
+def _visualization(
+    chart_type: str, metric: str, data: list[dict[str, Any]]
 ) -> VisualizationPayload | None:
-    data = []
-    for result in step_results:
-        output = result.get("output")
-        if isinstance(output, IncomeStatementData):
-            value = output.get_metric(metric)
-            if value is not None:
-                data.append({"period": output.period_label, "value": value})
-        elif isinstance(output, AggregationResult):
-            for period, value in zip(output.periods, output.values):
-                data.append({"period": period, "value": value})
     if not data:
         return None
-    return VisualizationPayload(chart_type="timeseries", metric=metric, data=data)
+    return VisualizationPayload(chart_type=chart_type, metric=metric, data=data)
 
 
 def build_citations(step_results: list[dict[str, Any]]) -> list[SourceCitation]:
@@ -92,14 +95,8 @@ def build_citations(step_results: list[dict[str, Any]]) -> list[SourceCitation]:
     citations = []
     for result in step_results:
         output = result.get("output")
-        if isinstance(output, IncomeStatementData):
-            m = output.metadata
-            citations.append(SourceCitation(
-                ticker=m.ticker,
-                filing_type=m.filing_type,
-                filing_date=str(m.filing_date) if m.filing_date else None,
-                fiscal_period=output.period_label,
-            ))
+        if type(output) is IncomeStatementData:
+            citations.append(_citation(output))
     return citations
 
 
@@ -108,7 +105,7 @@ def build_raw_data(step_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
     raw = []
     for result in step_results:
         output = result.get("output")
-        if isinstance(output, IncomeStatementData):
+        if type(output) is IncomeStatementData:
             raw.append(output.model_dump(mode="json"))
     return raw
 
@@ -118,6 +115,57 @@ def build_computations(step_results: list[dict[str, Any]]) -> list[dict[str, Any
     computations = []
     for result in step_results:
         output = result.get("output")
-        if isinstance(output, (GrowthResult, MarginResult, AggregationResult)):
+        if type(output) in _COMPUTATION_TYPES:
             computations.append(output.model_dump(mode="json"))
     return computations
+
+
+def _citation(output: IncomeStatementData) -> SourceCitation:
+    m = output.metadata
+    return SourceCitation(
+        ticker=m.ticker,
+        filing_type=m.filing_type,
+        filing_date=str(m.filing_date) if m.filing_date else None,
+        fiscal_period=output.period_label,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Single-pass response building
+# ---------------------------------------------------------------------------
+
+def build_response_bundle(
+    query_type: QueryType,
+    metric: str,
+    step_results: list[dict[str, Any]],
+) -> tuple[
+    VisualizationPayload | None,
+    list[SourceCitation],
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+]:
+    """Build visualization, citations, raw data and computations in one pass.
+
+    Equivalent to calling format_visualization, build_citations,
+    build_raw_data and build_computations on the same step results.
+    """
+    chart_type, handlers = _CHARTS.get(query_type, (None, {}))
+    data: list[dict[str, Any]] = []
+    citations: list[SourceCitation] = []
+    raw: list[dict[str, Any]] = []
+    computations: list[dict[str, Any]] = []
+
+    for result in step_results:
+        output = result.get("output")
+        output_type = type(output)
+        if output_type is IncomeStatementData:
+            raw.append(output.model_dump(mode="json"))
+            citations.append(_citation(output))
+        elif output_type in _COMPUTATION_TYPES:
+            computations.append(output.model_dump(mode="json"))
+        handler = handlers.get(output_type)
+        if handler is not None:
+            data.extend(handler(output, metric))
+
+    visualization = _visualization(chart_type, metric, data) if chart_type else None
+    return visualization, citations, raw, computations
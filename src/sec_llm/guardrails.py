@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from typing import Any
 
 from sec_llm.models import MetricName, SECLLMError
@@ -12,9 +13,9 @@ from sec_llm.models import MetricName, SECLLMError
 # Input validation
 # ---------------------------------------------------------------------------
 
-SUPPORTED_METRICS = {m.value for m in MetricName}
+SUPPORTED_METRICS: frozenset[str] = frozenset(m.value for m in MetricName)
 
-OUT_OF_SCOPE_KEYWORDS = [
+OUT_OF_SCOPE_KEYWORDS: tuple[str, ...] = (
     "balance sheet",
     "cash flow",
     "dcf",
@@ -32,7 +33,16 @@ OUT_OF_SCOPE_KEYWORDS = [
     "equity",
     "debt",
     "working capital",
-]
+)
+
+
+# One alternation over all keywords, so a message is scanned once in C
+_OUT_OF_SCOPE_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in OUT_OF_SCOPE_KEYWORDS),
+    re.IGNORECASE,
+)
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 
 
 class ScopeError(SECLLMError):
@@ -44,22 +54,22 @@ def check_scope(message: str) -> str | None:
 
     Returns an error message if out of scope, None if within scope.
     """
-    msg_lower = message.lower()
-    for keyword in OUT_OF_SCOPE_KEYWORDS:
-        if keyword in msg_lower:
-            return (
-                f"This query appears to be about '{keyword}', which is outside "
-                "the current scope. This tool supports income statement analysis only: "
-                "revenue, net income, EPS, gross margin, and operating income from "
-                "10-K and 10-Q filings."
-            )
-    return None
+    match = _OUT_OF_SCOPE_PATTERN.search(message)
+    if match is None:
+        return None
+    keyword = match.group(0).lower()
+    return (
+        f"This query appears to be about '{keyword}', which is outside "
+        "the current scope. This tool supports income statement analysis only: "
+        "revenue, net income, EPS, gross margin, and operating income from "
+        "10-K and 10-Q filings."
+    )
 
 
 def sanitize_input(message: str, max_length: int = 2000) -> str:
     """Sanitize user input: truncate and strip control characters."""
     message = message[:max_length]
-    message = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", message)
+    message = _CONTROL_CHARS.sub("", message)
     return message.strip()
 
 
@@ -67,6 +77,24 @@ def sanitize_input(message: str, max_length: int = 2000) -> str:
 # Hallucination check
 # ---------------------------------------------------------------------------
 
+# Percentages are tried first so "15.3%" is read once, as a percentage. A minus
+# sign only opens a number, so ranges like "40-45%" split into 40 and 45.
+_NUMBER_RE = re.compile(
+    r"(?<![\d,%])(?P<pct>-?[\d,]+\.?\d*)%"
+    r"|\$?(?P<num>[\d,]+\.?\d*)\s*(?P<scale>billion|million|thousand|trillion)?",
+    re.IGNORECASE,
+)
+
+_HAS_DIGIT = re.compile(r"\d")
+
+_SCALES = {
+    "trillion": 1_000_000_000_000,
+    "billion": 1_000_000_000,
+    "million": 1_000_000,
+    "thousand": 1_000,
+}
+
+
 def extract_numbers(text: str) -> list[float]:
     """Extract numeric values from a text string.
 
@@ -79,41 +107,31 @@ def extract_numbers(text: str) -> list[float]:
     """
     numbers: list[float] = []
 
-    dollar_scale = re.findall(
-        r"\$?([\d,]+\.?\d*)\s*(billion|million|thousand|trillion)?",
-        text,
-        re.IGNORECASE,
-    )
-    for num_str, scale in dollar_scale:
-        num_str = num_str.replace(",", "")
+    for match in _NUMBER_RE.finditer(text):
+        pct_str, num_str, scale = match.group("pct", "num", "scale")
         try:
-            value = float(num_str)
+            value = float((pct_str if pct_str is not None else num_str).replace(",", ""))
         except ValueError:
             continue
 
-        scale_lower = scale.lower() if scale else ""
-        if scale_lower == "trillion":
-            value *= 1_000_000_000_000
-        elif scale_lower == "billion":
-            value *= 1_000_000_000
-        elif scale_lower == "million":
-            value *= 1_000_000
-        elif scale_lower == "thousand":
-            value *= 1_000
+        if scale:
+            value *= _SCALES[scale.lower()]
 
         numbers.append(value)
 
-    percentages = re.findall(r"([\-\d,]+\.?\d*)%", text)
-    for pct_str in percentages:
-        pct_str = pct_str.replace(",", "")
-        try:
-            numbers.append(float(pct_str))
-        except ValueError:
-            continue
-
     return numbers
 
 
+_RAW_KEYS = (
+    "revenue", "cost_of_revenue", "gross_profit", "operating_income",
+    "net_income", "eps_basic", "eps_diluted",
+)
+_COMP_KEYS = (
+    "growth_rate", "growth_percentage", "current_value", "previous_value",
+    "margin_rate", "margin_percentage", "numerator", "revenue", "result",
+)
+
+
 def build_truth_set(
     raw_data: list[dict[str, Any]],
     computations: list[dict[str, Any]],
@@ -121,23 +139,19 @@ def build_truth_set(
     """Build a set of all known numeric values from raw data and computations."""
     truth: set[float] = set()
 
-    for data in raw_data:
-        for key in ("revenue", "cost_of_revenue", "gross_profit", "operating_income",
-                     "net_income", "eps_basic", "eps_diluted"):
-            value = data.get(key)
-            if value is not None:
-                truth.add(float(value))
-
-    for comp in computations:
-        for key in ("growth_rate", "growth_percentage", "current_value", "previous_value",
-                     "margin_rate", "margin_percentage", "numerator", "revenue",
-                     "result"):
-            value = comp.get(key)
-            if value is not None:
-                truth.add(float(value))
-        if "values" in comp:
-            for v in comp["values"]:
-                truth.add(float(v))
+    truth.update(
+        float(value)
+        for data in raw_data
+        for key in _RAW_KEYS
+        if (value := data.get(key)) is not None
+    )
+    truth.update(
+        float(value)
+        for comp in computations
+        for key in _COMP_KEYS
+        if (value := comp.get(key)) is not None
+    )
+    truth.update(float(v) for comp in computations for v in comp.get("values", ()))
 
     return truth
 
@@ -152,28 +166,32 @@ def verify_summary(
     Returns a list of unverified numbers (numbers found in the summary that
     don't match any known value within the tolerance).
     """
-    if not summary or not truth_set:
+    if not summary or not truth_set or not _HAS_DIGIT.search(summary):
         return []
 
     extracted = extract_numbers(summary)
+    truth_sorted = sorted(truth_set)
     unverified: list[float] = []
 
     for number in extracted:
-        if not _matches_any(number, truth_set, tolerance):
+        if not _matches_any(number, truth_sorted, tolerance):
             unverified.append(number)
 
     return unverified
 
 
-def _matches_any(value: float, truth_set: set[float], tolerance: float) -> bool:
-    """Check if a value matches any value in the truth set within tolerance."""
+def _matches_any(value: float, truth_sorted: list[float], tolerance: float) -> bool:
+    """Check if a value matches any value in the sorted truth list within tolerance.
+
+    The values matching ``value`` form an interval around it, so only the
+    nearest neighbour on each side needs checking.
+    """
+    i = bisect_left(truth_sorted, value)
     if value == 0:
-        return 0.0 in truth_set
+        return i < len(truth_sorted) and truth_sorted[i] == 0
 
-    for truth_val in truth_set:
+    for truth_val in truth_sorted[max(i - 1, 0) : i + 1]:
         if truth_val == 0:
-            if value == 0:
-                return True
             continue
         relative_diff = abs(value - truth_val) / abs(truth_val)
         if relative_diff <= tolerance:
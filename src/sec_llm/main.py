@@ -1,11 +1,15 @@
 """FastAPI application factory and lifespan."""
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from sec_llm.api.chat import prune_rate_state_periodically
 from sec_llm.api.router import api_router
 from sec_llm.config import Settings
+from sec_llm.dependencies import close_edgar_client, close_openai_client, get_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +17,17 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting SEC-LLM application")
+    # Build clients and agents now so the first request doesn't pay for it
+    get_pipeline()
+    rate_state_pruner = asyncio.create_task(prune_rate_state_periodically())
     yield
     # Shutdown
     logger.info("Shutting down SEC-LLM application")
+    rate_state_pruner.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await rate_state_pruner
+    await close_openai_client()
+    await close_edgar_client()
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
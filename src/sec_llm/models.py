@@ -131,6 +131,23 @@ class FilingMetadata(BaseModel):
     fiscal_period_end: date | None = None
 
 
+# Metric names as used by the planner → IncomeStatementData attribute
+_METRIC_ATTRS: dict[str, str] = {
+    "revenue": "revenue",
+    "net_income": "net_income",
+    "eps": "eps_diluted",
+    "gross_margin": "gross_profit",  # raw value; margin computed separately
+    "operating_income": "operating_income",
+}
+
+
+def format_period_label(fiscal_year: int, quarter: int | None = None) -> str:
+    """Format a period as "Q2 FY2024", or "FY2024" when quarter is None (annual)."""
+    if quarter:
+        return f"Q{quarter} FY{fiscal_year}"
+    return f"FY{fiscal_year}"
+
+
 class IncomeStatementData(BaseModel):
     metadata: FilingMetadata
     revenue: float | None = None
@@ -143,21 +160,13 @@ class IncomeStatementData(BaseModel):
 
     @property
     def period_label(self) -> str:
-        m = self.metadata
-        if m.quarter:
-            return f"Q{m.quarter} FY{m.fiscal_year}"
-        return f"FY{m.fiscal_year}"
+        # Formatted on access so copies and edits of metadata never go stale
+        return format_period_label(self.metadata.fiscal_year, self.metadata.quarter)
 
     def get_metric(self, metric_name: str) -> float | None:
         """Look up a metric value by name string."""
-        mapping = {
-            "revenue": self.revenue,
-            "net_income": self.net_income,
-            "eps": self.eps_diluted,
-            "gross_margin": self.gross_profit,  # raw value; margin computed separately
-            "operating_income": self.operating_income,
-        }
-        return mapping.get(metric_name)
+        attr = _METRIC_ATTRS.get(metric_name)
+        return getattr(self, attr) if attr else None
 
 
 # ---------------------------------------------------------------------------
@@ -165,6 +174,8 @@ class IncomeStatementData(BaseModel):
 # ---------------------------------------------------------------------------
 
 class GrowthResult(BaseModel):
+    model_config = {"frozen": True}
+
     metric_name: str
     current_value: float
     previous_value: float
@@ -176,6 +187,8 @@ class GrowthResult(BaseModel):
 
 
 class MarginResult(BaseModel):
+    model_config = {"frozen": True}
+
     metric_name: str
     numerator: float
     revenue: float
@@ -194,6 +207,21 @@ class AggregationResult(BaseModel):
     formula: str
 
 
+# ---------------------------------------------------------------------------
+# Summarization schemas
+# ---------------------------------------------------------------------------
+
+class SummaryItem(BaseModel):
+    id: int
+    summary: str
+
+
+class SummaryBatch(BaseModel):
+    """LLM returns one summary per numbered item in a batched request."""
+
+    summaries: list[SummaryItem]
+
+
 # ---------------------------------------------------------------------------
 # API response schemas
 # ---------------------------------------------------------------------------
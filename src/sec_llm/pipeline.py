@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Protocol
+import re
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Protocol
 
 from sec_llm.compute import ALL_TOOL_NAMES, COMPUTE_REGISTRY, DATA_TOOLS
-from sec_llm.formatter import (
-    build_citations,
-    build_computations,
-    build_raw_data,
-    format_visualization,
-)
+from sec_llm.formatter import build_response_bundle
 from sec_llm.guardrails import build_truth_set, verify_summary
 from sec_llm.models import (
     AnalysisResponse,
@@ -28,7 +26,10 @@ from sec_llm.sec.client import EdgarClient
 
 logger = logging.getLogger(__name__)
 
-_NULL_STRINGS = {"", "null", "none", "None"}
+_NULL_STRINGS: frozenset[str] = frozenset({"", "null", "none", "None"})
+
+# $step:N:field[:field...] — step id and the field path into its output
+_STEP_REF = re.compile(r"\$step:(\d+):(.*)", re.DOTALL)
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +52,13 @@ class SummarizerAgent(Protocol):
         computations: list[dict[str, Any]],
     ) -> str: ...
 
+    def stream_summarize(
+        self,
+        query: ClarifiedQuery,
+        raw_data: list[dict[str, Any]],
+        computations: list[dict[str, Any]],
+    ) -> AsyncGenerator[str, None]: ...
+
 
 # ---------------------------------------------------------------------------
 # Executor
@@ -59,37 +67,81 @@ class SummarizerAgent(Protocol):
 class ExecutionPlanExecutor:
     """Executes an ExecutionPlan, routing each step to the right handler."""
 
-    def __init__(self, edgar_client: EdgarClient):
+    def __init__(self, edgar_client: EdgarClient, max_concurrency: int = 8):
         self._edgar = edgar_client
+        self._max_concurrency = max_concurrency
 
     async def execute(self, plan: ExecutionPlan) -> list[dict[str, Any]]:
-        """Execute all plan steps in order. Returns a list of step results."""
+        """Execute all plan steps. Returns a list of step results in plan order.
+
+        Each step starts as soon as the steps it depends on have finished,
+        so independent fetches overlap (bounded by a semaphore) and a slow
+        fetch only holds back the steps that actually need its output.
+        """
         self._validate_plan(plan)
 
-        results: list[dict[str, Any]] = []
+        dependencies = _step_dependencies(plan)
+        results: list[dict[str, Any]] = [{} for _ in plan.steps]
         step_outputs: dict[int, Any] = {}
-
-        for step in plan.steps:
-            try:
-                output = await self._execute_step(step, step_outputs)
-                step_outputs[step.step_id] = output
-                results.append({
-                    "step_id": step.step_id,
-                    "tool": step.tool,
-                    "success": True,
-                    "output": output,
-                })
-            except Exception as exc:
-                logger.error("Step %d (%s) failed: %s", step.step_id, step.tool, exc)
-                results.append({
-                    "step_id": step.step_id,
-                    "tool": step.tool,
-                    "success": False,
-                    "error": str(exc),
-                })
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        done: set[int] = set()
+        pending = list(range(len(plan.steps)))
+        running: dict[asyncio.Task[Any], int] = {}
+
+        def start_ready() -> None:
+            for i in [i for i in pending if dependencies[i] <= done]:
+                pending.remove(i)
+                task = asyncio.ensure_future(
+                    self._run_step(plan.steps[i], step_outputs, semaphore)
+                )
+                running[task] = i
+
+        try:
+            # Dependencies only point at earlier steps, so the first pending
+            # step is always startable once everything running has finished.
+            start_ready()
+            while running:
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    i = running.pop(task)
+                    step = plan.steps[i]
+                    exc = task.exception()
+                    if exc is None:
+                        step_outputs[step.step_id] = task.result()
+                        results[i] = {
+                            "step_id": step.step_id,
+                            "tool": step.tool,
+                            "success": True,
+                            "output": task.result(),
+                        }
+                    elif isinstance(exc, Exception):
+                        logger.error("Step %d (%s) failed: %s", step.step_id, step.tool, exc)
+                        results[i] = {
+                            "step_id": step.step_id,
+                            "tool": step.tool,
+                            "success": False,
+                            "error": str(exc),
+                        }
+                    else:
+                        raise exc
+                    done.add(i)
+                start_ready()
+        finally:
+            for task in running:
+                task.cancel()
 
         return results
 
+    async def _run_step(
+        self, step: PlanStep, prior_outputs: dict[int, Any], semaphore: asyncio.Semaphore
+    ) -> Any:
+        if step.tool in DATA_TOOLS:
+            async with semaphore:
+                return await self._execute_step(step, prior_outputs)
+        return await self._execute_step(step, prior_outputs)
+
     async def _execute_step(
         self, step: PlanStep, prior_outputs: dict[int, Any]
     ) -> Any:
@@ -105,17 +157,14 @@ class ExecutionPlanExecutor:
 
     async def _execute_data_step(self, tool: str, args: dict[str, Any]) -> Any:
         if tool == "get_income_statement":
-            quarter_raw = args.get("quarter", "")
-            quarter = int(quarter_raw) if quarter_raw not in _NULL_STRINGS else None
-            fy_raw = args["fiscal_year"]
-            if fy_raw in _NULL_STRINGS:
+            fiscal_year = _parse_optional_int(args["fiscal_year"])
+            if fiscal_year is None:
                 raise ComputationError("fiscal_year is required")
-            result = await self._edgar.get_income_statement(
+            return await self._edgar.get_income_statement(
                 ticker=args["ticker"],
-                fiscal_year=int(fy_raw),
-                quarter=quarter,
+                fiscal_year=fiscal_year,
+                quarter=_parse_optional_int(args.get("quarter", "")),
             )
-            return result
         raise ComputationError(f"Unknown data tool: {tool}")
 
     def _execute_compute_step(self, tool: str, args: dict[str, Any]) -> Any:
@@ -126,6 +175,9 @@ class ExecutionPlanExecutor:
         self, args: dict[str, Any], prior_outputs: dict[int, Any]
     ) -> dict[str, Any]:
         """Resolve $step:N:field references to prior step outputs."""
+        if not any(_has_step_ref(value) for value in args.values()):
+            return args
+
         resolved = {}
         for key, value in args.items():
             if isinstance(value, str) and value.startswith("$step:"):
@@ -143,12 +195,12 @@ class ExecutionPlanExecutor:
 
     def _dereference(self, ref: str, prior_outputs: dict[int, Any]) -> Any:
         """Resolve a $step:N:field reference."""
-        parts = ref.split(":")
-        if len(parts) < 3:
+        match = _STEP_REF.match(ref)
+        if match is None:
             raise ComputationError(f"Invalid step reference: {ref}")
 
-        step_id = int(parts[1])
-        field_path = parts[2:]
+        step_id = int(match.group(1))
+        field_path = match.group(2).split(":")
 
         if step_id not in prior_outputs:
             raise ComputationError(f"Step {step_id} output not found for reference: {ref}")
@@ -181,6 +233,46 @@ class ExecutionPlanExecutor:
                 raise ComputationError(f"Unknown tool in plan: {step.tool}")
 
 
+def _step_dependencies(plan: ExecutionPlan) -> list[set[int]]:
+    """Map each step (by plan position) to the positions of the steps it needs.
+
+    A step depends on the steps it lists in depends_on and the steps its
+    $step:N references point at. Only earlier steps count — a step can't
+    use the output of one that comes after it in the plan — which keeps
+    the graph acyclic.
+    """
+    positions: dict[int, int] = {}
+    dependencies: list[set[int]] = []
+    for i, step in enumerate(plan.steps):
+        needed = set(step.depends_on) | _referenced_steps(step)
+        dependencies.append({positions[d] for d in needed if d in positions})
+        positions[step.step_id] = i
+    return dependencies
+
+
+def _referenced_steps(step: PlanStep) -> set[int]:
+    """Return the step ids referenced by $step:N:field values in a step's args."""
+    referenced = set()
+    for arg in step.args:
+        match = _STEP_REF.match(arg.value)
+        if match is not None:
+            referenced.add(int(match.group(1)))
+    return referenced
+
+
+def _parse_optional_int(value: str) -> int | None:
+    """Parse an LLM-supplied integer arg, treating empty/null-ish strings as None."""
+    return None if value in _NULL_STRINGS else int(value)
+
+
+def _has_step_ref(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.startswith("$step:")
+    if isinstance(value, list):
+        return any(isinstance(v, str) and v.startswith("$step:") for v in value)
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Pipeline
 # ---------------------------------------------------------------------------
@@ -206,43 +298,94 @@ class QueryPipeline:
         clarification = await self._clarifier.clarify(query)
 
         if clarification.needs_clarification:
-            return AnalysisResponse(
-                needs_clarification=True,
-                follow_up_question=clarification.follow_up_question,
-            )
+            return _clarification_response(clarification)
 
         clarified = clarification.clarified_query
         assert clarified is not None
 
-        # Step 2: Planning
-        plan = await self._planner.plan(clarified)
-        logger.info("Execution plan: %s", plan.model_dump_json(indent=2))
-
-        # Step 3: Execution
-        step_results = await self._executor.execute(plan)
-
-        # Step 4: Build structured response
-        raw_data = build_raw_data(step_results)
-        computations = build_computations(step_results)
-        citations = build_citations(step_results)
-        primary_metric = clarified.metrics[0].value
-        visualization = format_visualization(clarified.query_type, primary_metric, step_results)
+        # Steps 2-4: Plan, execute, build structured response
+        response = await self._build_results(clarified)
 
         # Step 5: Summarize
-        summary = await self._summarizer.summarize(clarified, raw_data, computations)
+        summary = await self._summarizer.summarize(
+            clarified, response.raw_data, response.computations
+        )
 
         # Step 6: Hallucination check (soft mode)
-        truth_set = build_truth_set(raw_data, computations)
-        unverified = verify_summary(summary, truth_set)
+        return _with_verified_summary(response, summary)
+
+    async def process_stream(
+        self, query: UserQuery
+    ) -> AsyncGenerator[tuple[str, AnalysisResponse | str], None]:
+        """Run the pipeline, streaming the summary as it is generated.
+
+        Yields ("data", response) with everything except the summary, then
+        ("delta", text) per summary chunk, then ("response", response) with
+        the final summary and guardrails. A query that needs clarification
+        yields a single ("response", response).
+        """
+        clarification = await self._clarifier.clarify(query)
+
+        if clarification.needs_clarification:
+            yield "response", _clarification_response(clarification)
+            return
+
+        clarified = clarification.clarified_query
+        assert clarified is not None
+
+        response = await self._build_results(clarified)
+        yield "data", response
+
+        chunks: list[str] = []
+        # Closing this generator early (client disconnect) closes the summary stream too
+        async with aclosing(
+            self._summarizer.stream_summarize(clarified, response.raw_data, response.computations)
+        ) as deltas:
+            async for delta in deltas:
+                chunks.append(delta)
+                yield "delta", delta
 
+        yield "response", _with_verified_summary(response, "".join(chunks))
+
+    async def _build_results(self, clarified: ClarifiedQuery) -> AnalysisResponse:
+        """Plan and execute a clarified query; returns a response without a summary."""
+        # Planning
+        plan = await self._planner.plan(clarified)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Execution plan: %s", plan.model_dump_json(indent=2))
+
+        # Execution
+        step_results = await self._executor.execute(plan)
+
+        # Build structured response
+        primary_metric = clarified.metrics[0].value
+        visualization, citations, raw_data, computations = build_response_bundle(
+            clarified.query_type, primary_metric, step_results
+        )
         return AnalysisResponse(
             raw_data=raw_data,
             computations=computations,
-            summary=summary,
             citations=citations,
             visualization=visualization,
-            guardrails=GuardrailInfo(
-                llm_computed_math=False,
-                unverified_numbers=unverified,
-            ),
         )
+
+
+def _clarification_response(clarification: ClarificationResponse) -> AnalysisResponse:
+    return AnalysisResponse(
+        needs_clarification=True,
+        follow_up_question=clarification.follow_up_question,
+    )
+
+
+def _with_verified_summary(response: AnalysisResponse, summary: str) -> AnalysisResponse:
+    """Attach the summary and flag any numbers in it that aren't in the results."""
+    truth_set = build_truth_set(response.raw_data, response.computations)
+    unverified = verify_summary(summary, truth_set)
+
+    return response.model_copy(update={
+        "summary": summary,
+        "guardrails": GuardrailInfo(
+            llm_computed_math=False,
+            unverified_numbers=unverified,
+        ),
+    })
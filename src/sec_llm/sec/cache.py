@@ -1,33 +1,101 @@
-"""Simple in-memory TTL cache."""
+"""Simple in-memory TTL/LRU cache and a persistent on-disk JSON cache."""
 
 from __future__ import annotations
 
+import json
+import os
+import re
+import tempfile
 import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
 
 class TTLCache:
-    """Thread-safe-ish TTL cache backed by a plain dict."""
+    """Thread-safe-ish TTL cache backed by an OrderedDict.
+
+    Holds at most max_entries values; past that, the least recently used
+    entry is evicted so a long-running server's memory stays bounded.
+    """
 
-    def __init__(self, ttl_seconds: int = 900):
+    def __init__(self, ttl_seconds: int = 900, max_entries: int = 1024):
         self._ttl = ttl_seconds
-        self._store: dict[str, tuple[float, Any]] = {}
+        self._max_entries = max_entries
+        # key → (monotonic expiry time, value)
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
     def get(self, key: str) -> Any | None:
         entry = self._store.get(key)
         if entry is None:
             return None
-        ts, value = entry
-        if time.monotonic() - ts > self._ttl:
-            del self._store[key]
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            # pop, not del: another thread may have evicted it already
+            self._store.pop(key, None)
             return None
+        self._store.move_to_end(key)
         return value
 
     def set(self, key: str, value: Any) -> None:
-        self._store[key] = (time.monotonic(), value)
+        self._store[key] = (time.monotonic() + self._ttl, value)
+        self._store.move_to_end(key)
+        if len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
 
     def clear(self) -> None:
         self._store.clear()
 
     def __contains__(self, key: str) -> bool:
-        return self.get(key) is not None
+        entry = self._store.get(key)
+        return entry is not None and time.monotonic() <= entry[0]
+
+
+class FileCache:
+    """JSON-file cache that survives process restarts, one file per key.
+
+    Entries expire based on file mtime. Writes go through a temp file and
+    os.replace so readers never see a partially written entry. Methods do
+    blocking disk IO; call them via asyncio.to_thread from async code.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], ttl_seconds: int = 90 * 24 * 3600):
+        self._dir = Path(directory)
+        self._ttl = ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{_UNSAFE_KEY_CHARS.sub('_', key)}.json"
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl:
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            try:
+                f = os.fdopen(fd, "w", encoding="utf-8")
+            except BaseException:
+                # fdopen didn't take ownership of the descriptor
+                os.close(fd)
+                raise
+            with f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """Remove every entry, plus temp files left by interrupted writes."""
+        for pattern in ("*.json", "*.tmp"):
+            for path in self._dir.glob(pattern):
+                path.unlink(missing_ok=True)
@@ -4,27 +4,62 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import logging
 import os
-from datetime import date
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import Any
 
+from pydantic import ValidationError
+
 from sec_llm.models import CompanyNotFoundError, FilingNotFoundError, IncomeStatementData
-from sec_llm.sec.cache import TTLCache
+from sec_llm.sec.cache import FileCache, TTLCache
 from sec_llm.sec.extractor import extract_income_statement
 
+logger = logging.getLogger(__name__)
+
 
 class EdgarClient:
     """Async-friendly facade over edgartools."""
 
-    def __init__(self, identity: str, cache_ttl: int = 900):
+    def __init__(
+        self,
+        identity: str,
+        cache_ttl: int = 900,
+        disk_cache_dir: str | None = None,
+        disk_cache_ttl: int = 90 * 24 * 3600,
+        max_workers: int = 8,
+    ):
         # Set identity before importing edgartools
         os.environ.setdefault("EDGAR_IDENTITY", identity)
         self._cache = TTLCache(ttl_seconds=cache_ttl)
+        # Filed statements don't change, so parsed results can outlive the process
+        self._disk_cache = (
+            FileCache(disk_cache_dir, ttl_seconds=disk_cache_ttl) if disk_cache_dir else None
+        )
+        # Own pool for edgartools calls: its size caps concurrent EDGAR requests
+        # process-wide and keeps slow fetches off the shared default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="edgar"
+        )
+        # edgartools Company objects and filing listings, shared by the pool's
+        # threads so a multi-period plan looks a ticker up once
+        self._edgar_objects = TTLCache(ttl_seconds=cache_ttl, max_entries=256)
+        # One lock per key with a load in flight; dropped once the load is done
+        self._edgar_loading: dict[str, threading.Lock] = {}
+        self._edgar_guard = threading.Lock()
 
     async def _run_sync(self, fn, *args, **kwargs):
-        """Run a blocking function in the default executor."""
+        """Run a blocking function in the client's EDGAR thread pool."""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def aclose(self) -> None:
+        """Shut down the EDGAR thread pool, dropping fetches that haven't started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def get_company_info(self, ticker: str) -> dict[str, Any]:
         """Look up basic company information by ticker."""
@@ -49,20 +84,91 @@ class EdgarClient:
         if cached is not None:
             return cached
 
+        if self._disk_cache is not None:
+            stored = await asyncio.to_thread(self._disk_cache.get, cache_key)
+            if stored is not None:
+                try:
+                    result = IncomeStatementData.model_validate(stored)
+                except ValidationError as exc:
+                    # Stale schema or a foreign file: refetch and overwrite it
+                    logger.warning("Ignoring invalid disk cache entry %s: %s", cache_key, exc)
+                else:
+                    self._cache.set(cache_key, result)
+                    return result
+
         result = await self._run_sync(
             self._fetch_income_statement, ticker, fiscal_year, quarter
         )
         self._cache.set(cache_key, result)
+        # An all-None parse usually means a transient edgartools failure that
+        # was swallowed; don't pin it on disk for the full TTL
+        if self._disk_cache is not None and _has_metrics(result):
+            try:
+                await asyncio.to_thread(
+                    self._disk_cache.set, cache_key, result.model_dump(mode="json")
+                )
+            except OSError as exc:
+                logger.warning("Could not write disk cache entry %s: %s", cache_key, exc)
         return result
 
-    @staticmethod
-    def _fetch_company_info(ticker: str) -> dict[str, Any]:
+    def _get_company(self, ticker: str) -> Any:
+        """Return the (memoized) edgartools Company for a ticker. Blocking."""
         from edgar import Company
 
-        try:
-            company = Company(ticker)
-        except Exception as exc:
-            raise CompanyNotFoundError(f"Company not found for ticker: {ticker}") from exc
+        def load() -> Any:
+            try:
+                return Company(ticker)
+            except Exception as exc:
+                raise CompanyNotFoundError(f"Company not found for ticker: {ticker}") from exc
+
+        return self._memoized(f"company:{ticker.upper()}", load)
+
+    def _get_filings(self, ticker: str, form: str) -> Any:
+        """Return the (memoized) filings listing of one form for a ticker. Blocking."""
+        return self._memoized(
+            f"filings:{ticker.upper()}:{form}",
+            lambda: self._get_company(ticker).get_filings(form=form),
+        )
+
+    def _get_filing_index(self, ticker: str, form: str) -> dict[tuple[int, int | None], Any]:
+        """Return the (memoized) (fiscal_year, quarter) index of a filings listing. Blocking."""
+        return self._memoized(
+            f"filing-index:{ticker.upper()}:{form}",
+            lambda: _index_filings(self._get_filings(ticker, form), quarterly=form == "10-Q"),
+        )
+
+    def _memoized(self, key: str, load) -> Any:
+        """Get key from the edgartools object cache, loading it at most once at a time.
+
+        Runs on pool threads: a per-key lock makes concurrent callers for the
+        same key wait for one load instead of all hitting EDGAR. The lock only
+        lives while a load is in flight, so locks don't pile up for every key
+        ever seen. Loads may nest (filings → company), so keys never share one.
+        """
+        with self._edgar_guard:
+            value = self._edgar_objects.get(key)
+            if value is not None:
+                return value
+            lock = self._edgar_loading.get(key)
+            if lock is None:
+                lock = self._edgar_loading[key] = threading.Lock()
+
+        with lock:
+            try:
+                with self._edgar_guard:
+                    value = self._edgar_objects.get(key)
+                if value is None:
+                    value = load()
+                    with self._edgar_guard:
+                        self._edgar_objects.set(key, value)
+            finally:
+                with self._edgar_guard:
+                    if self._edgar_loading.get(key) is lock:
+                        del self._edgar_loading[key]
+        return value
+
+    def _fetch_company_info(self, ticker: str) -> dict[str, Any]:
+        company = self._get_company(ticker)
 
         cik_str = str(company.cik)
         if cik_str.startswith("-") or company.name.startswith("Entity -"):
@@ -82,21 +188,16 @@ class EdgarClient:
             "entity_type": getattr(company, "entity_type", ""),
         }
 
-    @staticmethod
     def _fetch_income_statement(
+        self,
         ticker: str,
         fiscal_year: int,
         quarter: int | None = None,
     ) -> IncomeStatementData:
-        from edgar import Company
-
-        try:
-            company = Company(ticker)
-        except Exception as exc:
-            raise CompanyNotFoundError(f"Company not found for ticker: {ticker}") from exc
+        company = self._get_company(ticker)
 
         filing_type = "10-Q" if quarter else "10-K"
-        filings = company.get_filings(form=filing_type)
+        filings = self._get_filings(ticker, filing_type)
 
         if filings is None or len(filings) == 0:
             raise FilingNotFoundError(
@@ -104,7 +205,7 @@ class EdgarClient:
             )
 
         # Find the filing matching the requested fiscal year / quarter
-        target_filing = _find_matching_filing(filings, fiscal_year, quarter)
+        target_filing = self._get_filing_index(ticker, filing_type).get((fiscal_year, quarter))
         if target_filing is None:
             raise FilingNotFoundError(
                 f"No {filing_type} filing found for {ticker} "
@@ -146,61 +247,68 @@ class EdgarClient:
         )
 
 
-def _find_matching_filing(filings, fiscal_year: int, quarter: int | None) -> Any | None:
-    """Find a filing matching the requested fiscal year and quarter.
+_METRIC_FIELDS = tuple(name for name in IncomeStatementData.model_fields if name != "metadata")
+
+
+def _has_metrics(data: IncomeStatementData) -> bool:
+    return any(getattr(data, name) is not None for name in _METRIC_FIELDS)
 
-    Uses filing date heuristics since edgartools doesn't always expose
-    fiscal period metadata directly.
+
+# Calendar month of the period of report → approximate quarter. This is a
+# rough heuristic; fiscal year ends vary by company.
+_MONTH_TO_QUARTER = {
+    1: 1, 2: 1, 3: 1,
+    4: 2, 5: 2, 6: 2,
+    7: 3, 8: 3, 9: 3,
+    10: 4, 11: 4, 12: 4,
+}
+
+
+def _index_filings(filings, quarterly: bool) -> dict[tuple[int, int | None], Any]:
+    """Index filings by (fiscal_year, quarter) in one pass; quarter is None for 10-Ks.
+
+    Quarterly filings are keyed by their period of report. Annual filings
+    are keyed by their period of report year when filed that year or the
+    next. A 10-K without a period of report stands in for the fiscal year
+    it was filed in and the one before, unless a dated 10-K claims that
+    year. If several filings claim the same period, the earliest filed wins.
     """
+    by_period: dict[tuple[int, int | None], tuple[date, Any]] = {}
+    by_filing_year: dict[tuple[int, int | None], Any] = {}
+
     for filing in filings:
-        filing_date_val = getattr(filing, "filing_date", None)
-        if filing_date_val is None:
+        filed = _as_date(getattr(filing, "filing_date", None))
+        if filed is None:
             continue
+        period = _as_date(getattr(filing, "period_of_report", None))
 
-        if isinstance(filing_date_val, str):
-            try:
-                filing_date_val = date.fromisoformat(filing_date_val)
-            except ValueError:
+        if quarterly:
+            if period is None:
                 continue
-
-        # For annual (10-K): match by year
-        if quarter is None:
-            # 10-K filings are typically filed in the first few months after fiscal year end
-            # A filing dated in early FY+1 corresponds to FY
-            if filing_date_val.year == fiscal_year or filing_date_val.year == fiscal_year + 1:
-                # Check period of report if available
-                period_of_report = getattr(filing, "period_of_report", None)
-                if period_of_report:
-                    if isinstance(period_of_report, str):
-                        try:
-                            period_of_report = date.fromisoformat(period_of_report)
-                        except ValueError:
-                            period_of_report = None
-                    if period_of_report and period_of_report.year == fiscal_year:
-                        return filing
-                # Fallback: trust the year range
-                if filing_date_val.year in (fiscal_year, fiscal_year + 1):
-                    return filing
+            key = (period.year, _MONTH_TO_QUARTER[period.month])
+        elif period is None:
+            # 10-K filings are typically filed in the first few months after
+            # fiscal year end, so a filing dated in early FY+1 corresponds to FY
+            by_filing_year.setdefault((filed.year, None), filing)
+            by_filing_year.setdefault((filed.year - 1, None), filing)
+            continue
+        elif filed.year in (period.year, period.year + 1):
+            key = (period.year, None)
         else:
-            # For quarterly (10-Q): match quarter by period_of_report month
-            period_of_report = getattr(filing, "period_of_report", None)
-            if period_of_report:
-                if isinstance(period_of_report, str):
-                    try:
-                        period_of_report = date.fromisoformat(period_of_report)
-                    except ValueError:
-                        continue
-
-                # Map calendar month → approximate quarter
-                # This is a rough heuristic; fiscal year ends vary by company
-                month_to_quarter = {
-                    3: 1, 4: 2, 6: 2, 7: 3, 9: 3, 10: 4, 12: 4,
-                    1: 1, 2: 1, 5: 2, 8: 3, 11: 4,
-                }
-                report_quarter = month_to_quarter.get(period_of_report.month)
-                report_year = period_of_report.year
-
-                if report_year == fiscal_year and report_quarter == quarter:
-                    return filing
-
-    return None
+            continue
+
+        if key not in by_period or filed < by_period[key][0]:
+            by_period[key] = (filed, filing)
+
+    return {**by_filing_year, **{key: filing for key, (_, filing) in by_period.items()}}
+
+
+def _as_date(value: Any) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
@@ -7,7 +7,12 @@ from datetime import date
 from typing import Any
 
 from sec_llm.models import FilingMetadata, IncomeStatementData
-from sec_llm.sec.normalizer import LABEL_CANDIDATES, find_row_value
+from sec_llm.sec.normalizer import (
+    LABEL_CANDIDATES,
+    LabelIndex,
+    build_label_index,
+    find_indexed_value,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,32 +43,37 @@ def extract_income_statement(
         quarter=quarter,
     )
 
+    # Both strategies read metrics from the income statement DataFrame, so
+    # locate and index it once
+    index = build_label_index(_get_income_statement_df(financials))
+
     # Strategy 1: Use direct accessor methods if the object supports them
-    result = _try_direct_accessors(financials, metadata)
+    result = _try_direct_accessors(financials, metadata, index)
     if result is not None:
         return result
 
     # Strategy 2: Fall back to DataFrame label matching
-    df = _get_income_statement_df(financials)
 
     return IncomeStatementData(
         metadata=metadata,
-        revenue=find_row_value(df, LABEL_CANDIDATES["revenue"]),
-        cost_of_revenue=find_row_value(df, LABEL_CANDIDATES["cost_of_revenue"]),
-        gross_profit=find_row_value(df, LABEL_CANDIDATES["gross_profit"]),
-        operating_income=find_row_value(df, LABEL_CANDIDATES["operating_income"]),
-        net_income=find_row_value(df, LABEL_CANDIDATES["net_income"]),
-        eps_basic=find_row_value(df, LABEL_CANDIDATES["eps_basic"]),
-        eps_diluted=find_row_value(df, LABEL_CANDIDATES["eps_diluted"]),
+        revenue=find_indexed_value(index, LABEL_CANDIDATES["revenue"]),
+        cost_of_revenue=find_indexed_value(index, LABEL_CANDIDATES["cost_of_revenue"]),
+        gross_profit=find_indexed_value(index, LABEL_CANDIDATES["gross_profit"]),
+        operating_income=find_indexed_value(index, LABEL_CANDIDATES["operating_income"]),
+        net_income=find_indexed_value(index, LABEL_CANDIDATES["net_income"]),
+        eps_basic=find_indexed_value(index, LABEL_CANDIDATES["eps_basic"]),
+        eps_diluted=find_indexed_value(index, LABEL_CANDIDATES["eps_diluted"]),
     )
 
 
-def _try_direct_accessors(financials: Any, metadata: FilingMetadata) -> IncomeStatementData | None:
+def _try_direct_accessors(
+    financials: Any, metadata: FilingMetadata, index: LabelIndex | None
+) -> IncomeStatementData | None:
     """Try to extract metrics using direct accessor methods on a Financials object.
 
     Uses get_revenue() and get_net_income() from the Financials object (the only
     income-related accessors edgartools provides), then supplements remaining
-    metrics from the income statement DataFrame.
+    metrics from the prepared income statement index.
     """
     # Use the only two accessor methods that exist on Financials
     revenue = _safe_call(financials, "get_revenue")
@@ -72,13 +82,12 @@ def _try_direct_accessors(financials: Any, metadata: FilingMetadata) -> IncomeSt
     if revenue is None and net_income is None:
         return None
 
-    # For remaining metrics, get the income statement DataFrame
-    df = _get_income_statement_df(financials)
-    gross_profit = find_row_value(df, LABEL_CANDIDATES["gross_profit"])
-    operating_income = find_row_value(df, LABEL_CANDIDATES["operating_income"])
-    cost_of_revenue = find_row_value(df, LABEL_CANDIDATES["cost_of_revenue"])
-    eps_basic = find_row_value(df, LABEL_CANDIDATES["eps_basic"])
-    eps_diluted = find_row_value(df, LABEL_CANDIDATES["eps_diluted"])
+    # For remaining metrics, use the income statement DataFrame
+    gross_profit = find_indexed_value(index, LABEL_CANDIDATES["gross_profit"])
+    operating_income = find_indexed_value(index, LABEL_CANDIDATES["operating_income"])
+    cost_of_revenue = find_indexed_value(index, LABEL_CANDIDATES["cost_of_revenue"])
+    eps_basic = find_indexed_value(index, LABEL_CANDIDATES["eps_basic"])
+    eps_diluted = find_indexed_value(index, LABEL_CANDIDATES["eps_diluted"])
 
     return IncomeStatementData(
         metadata=metadata,
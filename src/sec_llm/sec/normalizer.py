@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import re
-from typing import Any
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+from sec_llm.models import format_period_label  # noqa: F401  (re-exported)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Candidate label lists for each income statement metric.
 # edgartools DataFrames use varying labels depending on the filing.
@@ -64,21 +68,39 @@ LABEL_CANDIDATES: dict[str, list[str]] = {
 }
 
 
-def find_row_value(
+_NON_VALUE_COLS = {"label", "concept", "level", "abstract", "units"}
+
+
+@dataclass(frozen=True)
+class LabelIndex:
+    """A statement DataFrame prepared for repeated label lookups.
+
+    Holds every label source case-folded once, in row order, alongside the
+    value column, so each lookup is a dict probe or a plain substring scan
+    with no pandas.
+    """
+
+    sources: tuple[tuple[str, ...], ...]
+    values: Any  # numpy array of the value column, by row position
+    exact: dict[str, int]  # case-folded label → position of its first row
+
+
+def build_label_index(
     df: pd.DataFrame,
-    candidates: list[str],
     value_column: str | None = None,
-) -> float | None:
-    """Search a DataFrame for the first matching label candidate.
+) -> LabelIndex | None:
+    """Prepare a DataFrame for find_indexed_value; None if it has no usable rows.
 
     The DataFrame is expected to have a label/concept column (typically the index
     or a column like 'label') and one or more value columns.
-
-    Returns the value as a float, or None if no match is found.
     """
     if df is None or df.empty:
         return None
 
+    # pandas is only needed once a statement is being parsed; keep it off the
+    # import path of the app
+    import pandas as pd
+
     # Determine which column(s) contain the row labels
     # Try multiple label sources for better matching across edgartools versions
     label_columns: list[pd.Series] = []
@@ -94,7 +116,6 @@ def find_row_value(
         label_columns.append(df.iloc[:, 0])
 
     # Determine value column: skip known non-value columns
-    _NON_VALUE_COLS = {"label", "concept", "level", "abstract", "units"}
     if value_column is not None and value_column in df.columns:
         val_col = value_column
     else:
@@ -106,31 +127,76 @@ def find_row_value(
     if val_col is None:
         return None
 
-    # Search for candidates across all label columns (case-insensitive partial match)
-    for candidate in candidates:
-        candidate_lower = candidate.lower()
-        for label_series in label_columns:
-            label_lower = label_series.astype(str).str.lower()
-            mask = label_lower.str.contains(re.escape(candidate_lower), case=False, na=False)
-            matches = df.loc[mask]
-            if not matches.empty:
-                raw_value = matches.iloc[0][val_col] if val_col in matches.columns else matches.iloc[0, -1]
-                return _to_float(raw_value)
+    sources = tuple(
+        tuple(label_series.astype(str).str.casefold()) for label_series in label_columns
+    )
+    exact: dict[str, int] = {}
+    for labels in sources:
+        for position, label in enumerate(labels):
+            exact.setdefault(label, position)
+
+    return LabelIndex(sources=sources, values=df[val_col].to_numpy(), exact=exact)
+
+
+def find_indexed_value(index: LabelIndex | None, candidates: list[str]) -> float | None:
+    """Return the value of the row matching the first matching candidate.
+
+    A label equal to a candidate (case-insensitively) wins over partial
+    matches, so "Revenue" isn't read off an earlier "Cost of revenue" row.
+    Failing that, candidates are tried in order; for each, label sources
+    are searched in order for a case-insensitive partial match.
+    """
+    if index is None or not candidates:
+        return None
+
+    needles = [candidate.casefold() for candidate in candidates]
+    for needle in needles:
+        position = index.exact.get(needle)
+        if position is not None:
+            return _to_float(index.values[position])
+
+    for needle in needles:
+        for labels in index.sources:
+            for position, label in enumerate(labels):
+                if needle in label:
+                    return _to_float(index.values[position])
 
     return None
 
 
+def find_row_value(
+    df: pd.DataFrame,
+    candidates: list[str],
+    value_column: str | None = None,
+) -> float | None:
+    """Search a DataFrame for the first matching label candidate.
+
+    Returns the value as a float, or None if no match is found. Callers doing
+    several lookups on one DataFrame should build_label_index it once instead.
+    """
+    return find_row_values(df, [candidates], value_column)[0]
+
+
+def find_row_values(
+    df: pd.DataFrame,
+    candidate_lists: list[list[str]],
+    value_column: str | None = None,
+) -> list[float | None]:
+    """Look up several metrics at once, one result per candidate list.
+
+    The DataFrame is indexed once for the whole batch.
+    """
+    if not any(candidate_lists):
+        return [None] * len(candidate_lists)
+    index = build_label_index(df, value_column)
+    return [find_indexed_value(index, candidates) for candidates in candidate_lists]
+
+
 def _to_float(value: Any) -> float | None:
     """Safely convert a value to float."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
         return None
     try:
         return float(value)
     except (ValueError, TypeError):
         return None
-
-
-def format_period_label(fiscal_year: int, quarter: int | None = None) -> str:
-    if quarter:
-        return f"Q{quarter} FY{fiscal_year}"
-    return f"FY{fiscal_year}"
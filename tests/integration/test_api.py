@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import time
+from collections import deque
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from sec_llm.api import chat as chat_module
+from sec_llm.api.chat import _check_rate_limit, _rate_state, _sse_events, prune_rate_state
 from sec_llm.config import Settings
 from sec_llm.main import create_app
+from sec_llm.models import AnalysisResponse, CompanyNotFoundError, UserQuery
 
 
 @pytest.fixture
@@ -30,3 +37,109 @@ class TestChatEndpoint:
             json={"message": "x" * 2001},
         )
         assert response.status_code == 422  # Pydantic validation error
+
+    def test_chat_returns_pipeline_response(self, client: TestClient, monkeypatch):
+        class StubPipeline:
+            async def process(self, query: UserQuery) -> AnalysisResponse:
+                return AnalysisResponse(summary=f"echo: {query.message}")
+
+        monkeypatch.setattr(chat_module, "get_pipeline", lambda: StubPipeline())
+        response = client.post("/api/chat", json={"message": "Apple revenue FY2024"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["summary"] == "echo: Apple revenue FY2024"
+        assert body["needs_clarification"] is False
+        assert body["guardrails"] == {"llm_computed_math": False, "unverified_numbers": []}
+
+    def test_chat_forwards_sanitized_message(self, client: TestClient, monkeypatch):
+        seen = []
+
+        class StubPipeline:
+            async def process(self, query: UserQuery) -> AnalysisResponse:
+                seen.append(query.message)
+                return AnalysisResponse()
+
+        monkeypatch.setattr(chat_module, "get_pipeline", lambda: StubPipeline())
+        client.post("/api/chat", json={"message": "  Apple\x00 revenue FY2024\x07 "})
+
+        assert seen == ["Apple revenue FY2024"]
+
+    def test_chat_stream_emits_sse_events(self, client: TestClient, monkeypatch):
+        class StubPipeline:
+            async def process_stream(self, query: UserQuery):
+                yield "data", AnalysisResponse()
+                yield "delta", "Revenue "
+                yield "delta", "grew."
+                yield "response", AnalysisResponse(summary="Revenue grew.")
+
+        monkeypatch.setattr(chat_module, "get_pipeline", lambda: StubPipeline())
+        response = client.post("/api/chat/stream", json={"message": "Apple revenue FY2024"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+        assert [lines[0] for lines in events] == [
+            "event: data", "event: delta", "event: delta", "event: response",
+        ]
+        assert events[1][1] == 'data: "Revenue "'
+        assert '"summary":"Revenue grew."' in events[3][1]
+
+    async def test_stream_disconnect_closes_pipeline_events(self):
+        closed = []
+
+        async def events():
+            try:
+                yield "delta", "Revenue "
+                yield "delta", "grew."
+            finally:
+                closed.append(True)
+
+        sse = _sse_events(("data", AnalysisResponse()), events())
+        assert (await anext(sse)).startswith("event: data")
+        assert (await anext(sse)).startswith("event: delta")
+        await sse.aclose()
+
+        assert closed == [True]
+
+    def test_chat_stream_maps_errors_before_first_event(self, client: TestClient, monkeypatch):
+        class FailingPipeline:
+            async def process_stream(self, query: UserQuery):
+                raise CompanyNotFoundError("Company not found for ticker: ZZZZ")
+                yield  # pragma: no cover
+
+        monkeypatch.setattr(chat_module, "get_pipeline", lambda: FailingPipeline())
+        response = client.post("/api/chat/stream", json={"message": "ZZZZ revenue FY2024"})
+
+        assert response.status_code == 404
+
+
+class TestRateLimit:
+    @pytest.fixture(autouse=True)
+    def _reset_state(self):
+        _rate_state.clear()
+        yield
+        _rate_state.clear()
+
+    def test_blocks_after_limit(self):
+        for _ in range(3):
+            _check_rate_limit("1.2.3.4", max_per_minute=3)
+        with pytest.raises(HTTPException) as exc_info:
+            _check_rate_limit("1.2.3.4", max_per_minute=3)
+        assert exc_info.value.status_code == 429
+
+    def test_limits_are_per_ip(self):
+        _check_rate_limit("1.2.3.4", max_per_minute=1)
+        _check_rate_limit("5.6.7.8", max_per_minute=1)
+
+    def test_expired_hits_are_dropped(self):
+        _rate_state["1.2.3.4"] = deque([time.monotonic() - 120.0])
+        _check_rate_limit("1.2.3.4", max_per_minute=1)
+        assert len(_rate_state["1.2.3.4"]) == 1
+
+    def test_prune_forgets_idle_ips(self):
+        _rate_state["1.2.3.4"] = deque([time.monotonic() - 120.0])
+        _check_rate_limit("5.6.7.8", max_per_minute=1)
+        prune_rate_state()
+        assert list(_rate_state) == ["5.6.7.8"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from sec_llm.models import (
@@ -46,6 +48,16 @@ class FakeSummarizer:
         metrics = [m.value for m in query.metrics]
         return f"Fake summary for {query.ticker}: {', '.join(metrics)}"
 
+    async def stream_summarize(
+        self,
+        query: ClarifiedQuery,
+        raw_data: list,
+        computations: list,
+    ):
+        summary = await self.summarize(query, raw_data, computations)
+        for word in summary.split(" "):
+            yield word + " "
+
 
 class FakePlanner:
     """Returns a hardcoded plan."""
@@ -70,6 +82,43 @@ class FakeEdgarClient:
         return self._data[key]
 
 
+class SlowEdgarClient(FakeEdgarClient):
+    """Tracks how many fetches are in flight at once."""
+
+    def __init__(self, data_map: dict[str, IncomeStatementData]):
+        super().__init__(data_map)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_income_statement(
+        self, ticker: str, fiscal_year: int, quarter: int | None = None
+    ) -> IncomeStatementData:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().get_income_statement(ticker, fiscal_year, quarter)
+
+
+class StaggeredEdgarClient(FakeEdgarClient):
+    """Delays each fetch by fiscal year and records start/end events."""
+
+    def __init__(
+        self, data_map: dict[str, IncomeStatementData], delays: dict[int, float]
+    ):
+        super().__init__(data_map)
+        self.delays = delays
+        self.events: list[tuple[str, int]] = []
+
+    async def get_income_statement(
+        self, ticker: str, fiscal_year: int, quarter: int | None = None
+    ) -> IncomeStatementData:
+        self.events.append(("start", fiscal_year))
+        await asyncio.sleep(self.delays[fiscal_year])
+        self.events.append(("end", fiscal_year))
+        return await super().get_income_statement(ticker, fiscal_year, quarter)
+
+
 def _make_income_data(
     fiscal_year: int,
     quarter: int | None = None,
@@ -116,8 +165,7 @@ class TestPipelineDirectRetrieval:
 
         fake_data = {"AAPL:2024:None": _make_income_data(2024, revenue=391_000_000_000.0)}
         fake_edgar = FakeEdgarClient(fake_data)
-        executor = ExecutionPlanExecutor.__new__(ExecutionPlanExecutor)
-        executor._edgar = fake_edgar
+        executor = ExecutionPlanExecutor(fake_edgar)
 
         summarizer = FakeSummarizer()
 
@@ -188,8 +236,7 @@ class TestPipelineGrowthComparison:
             "AAPL:2024:None": _make_income_data(2024, revenue=391_000_000_000.0),
         }
         fake_edgar = FakeEdgarClient(fake_data)
-        executor = ExecutionPlanExecutor.__new__(ExecutionPlanExecutor)
-        executor._edgar = fake_edgar
+        executor = ExecutionPlanExecutor(fake_edgar)
 
         pipeline = QueryPipeline(
             clarifier=FakeClarifier(clarified),
@@ -208,3 +255,172 @@ class TestPipelineGrowthComparison:
         assert "formula" in result.computations[0]
 
 
+def _fetch_step(step_id: int, fiscal_year: int, quarter: int | None = None) -> PlanStep:
+    args = [
+        ToolCallArg(name="ticker", value="AAPL"),
+        ToolCallArg(name="fiscal_year", value=str(fiscal_year)),
+    ]
+    if quarter is not None:
+        args.append(ToolCallArg(name="quarter", value=str(quarter)))
+    return PlanStep(step_id=step_id, tool="get_income_statement", args=args)
+
+
+class TestPipelineStreaming:
+    async def test_stream_yields_data_deltas_then_response(self):
+        clarified = ClarifiedQuery(
+            ticker="AAPL",
+            query_type=QueryType.direct_retrieval,
+            metrics=[MetricName.revenue],
+            periods=[FiscalPeriod(fiscal_year=2024)],
+            original_message="What was Apple's revenue in FY2024?",
+        )
+        plan = ExecutionPlan(steps=[_fetch_step(0, 2024)])
+        executor = ExecutionPlanExecutor(
+            FakeEdgarClient({"AAPL:2024:None": _make_income_data(2024)})
+        )
+        pipeline = QueryPipeline(
+            clarifier=FakeClarifier(clarified),
+            planner=FakePlanner(plan),
+            summarizer=FakeSummarizer(),
+            executor=executor,
+        )
+
+        events = [event async for event in pipeline.process_stream(UserQuery(message="test"))]
+
+        kinds = [kind for kind, _ in events]
+        assert kinds[0] == "data"
+        assert kinds[-1] == "response"
+        assert set(kinds[1:-1]) == {"delta"}
+        assert events[0][1].summary == ""
+        assert len(events[0][1].raw_data) == 1
+        final = events[-1][1]
+        assert final.summary == "".join(delta for kind, delta in events if kind == "delta")
+        assert final.citations[0].ticker == "AAPL"
+
+    async def test_closing_stream_closes_summary_stream(self):
+        closed = []
+
+        class ClosingSummarizer(FakeSummarizer):
+            async def stream_summarize(self, query, raw_data, computations):
+                try:
+                    yield "Revenue "
+                    yield "grew."
+                finally:
+                    closed.append(True)
+
+        clarified = ClarifiedQuery(
+            ticker="AAPL",
+            query_type=QueryType.direct_retrieval,
+            metrics=[MetricName.revenue],
+            periods=[FiscalPeriod(fiscal_year=2024)],
+            original_message="What was Apple's revenue in FY2024?",
+        )
+        pipeline = QueryPipeline(
+            clarifier=FakeClarifier(clarified),
+            planner=FakePlanner(ExecutionPlan(steps=[_fetch_step(0, 2024)])),
+            summarizer=ClosingSummarizer(),
+            executor=ExecutionPlanExecutor(
+                FakeEdgarClient({"AAPL:2024:None": _make_income_data(2024)})
+            ),
+        )
+
+        events = pipeline.process_stream(UserQuery(message="test"))
+        assert (await anext(events))[0] == "data"
+        assert await anext(events) == ("delta", "Revenue ")
+        await events.aclose()
+
+        assert closed == [True]
+
+
+class TestExecutorConcurrency:
+    async def test_independent_fetches_run_concurrently(self):
+        plan = ExecutionPlan(steps=[_fetch_step(i, 2024, i + 1) for i in range(4)])
+        edgar = SlowEdgarClient(
+            {f"AAPL:2024:{q}": _make_income_data(2024, quarter=q) for q in range(1, 5)}
+        )
+
+        results = await ExecutionPlanExecutor(edgar).execute(plan)
+
+        assert [r["step_id"] for r in results] == [0, 1, 2, 3]
+        assert all(r["success"] for r in results)
+        assert edgar.max_in_flight == 4
+
+    async def test_concurrency_is_bounded(self):
+        plan = ExecutionPlan(steps=[_fetch_step(i, 2024, i + 1) for i in range(4)])
+        edgar = SlowEdgarClient(
+            {f"AAPL:2024:{q}": _make_income_data(2024, quarter=q) for q in range(1, 5)}
+        )
+
+        await ExecutionPlanExecutor(edgar, max_concurrency=2).execute(plan)
+
+        assert edgar.max_in_flight == 2
+
+    async def test_failed_fetch_is_reported_per_step(self):
+        plan = ExecutionPlan(steps=[_fetch_step(0, 2023), _fetch_step(1, 2024)])
+        edgar = FakeEdgarClient({"AAPL:2024:None": _make_income_data(2024)})
+
+        results = await ExecutionPlanExecutor(edgar).execute(plan)
+
+        assert results[0]["success"] is False
+        assert results[1]["success"] is True
+
+    async def test_reference_without_depends_on_waits_for_fetch(self):
+        growth = PlanStep(
+            step_id=2,
+            tool="compute_yoy_growth",
+            args=[
+                ToolCallArg(name="metric_name", value="revenue"),
+                ToolCallArg(name="current_value", value="$step:1:revenue"),
+                ToolCallArg(name="previous_value", value="$step:0:revenue"),
+                ToolCallArg(name="current_period", value="FY2024"),
+                ToolCallArg(name="previous_period", value="FY2023"),
+            ],
+        )
+        plan = ExecutionPlan(steps=[_fetch_step(0, 2023), _fetch_step(1, 2024), growth])
+        edgar = SlowEdgarClient({
+            "AAPL:2023:None": _make_income_data(2023, revenue=100.0),
+            "AAPL:2024:None": _make_income_data(2024, revenue=120.0),
+        })
+
+        results = await ExecutionPlanExecutor(edgar).execute(plan)
+
+        assert edgar.max_in_flight == 2
+        assert results[2]["success"] is True
+        assert results[2]["output"].growth_percentage == 20.0
+
+    async def test_step_starts_when_its_own_dependencies_finish(self):
+        dependent = _fetch_step(2, 2022).model_copy(update={"depends_on": [1]})
+        plan = ExecutionPlan(steps=[_fetch_step(0, 2024), _fetch_step(1, 2023), dependent])
+        edgar = StaggeredEdgarClient(
+            {f"AAPL:{fy}:None": _make_income_data(fy) for fy in (2022, 2023, 2024)},
+            delays={2024: 0.05, 2023: 0.01, 2022: 0.01},
+        )
+
+        results = await ExecutionPlanExecutor(edgar).execute(plan)
+
+        assert all(r["success"] for r in results)
+        # Step 2 only waits on step 1, not on the slow, unrelated step 0
+        assert edgar.events.index(("start", 2022)) < edgar.events.index(("end", 2024))
+
+
+class TestStepReferences:
+    async def test_malformed_reference_fails_the_step(self):
+        growth = PlanStep(
+            step_id=1,
+            tool="compute_yoy_growth",
+            args=[
+                ToolCallArg(name="metric_name", value="revenue"),
+                ToolCallArg(name="current_value", value="$step:zero:revenue"),
+                ToolCallArg(name="previous_value", value="$step:0:revenue"),
+                ToolCallArg(name="current_period", value="FY2024"),
+                ToolCallArg(name="previous_period", value="FY2023"),
+            ],
+        )
+        plan = ExecutionPlan(steps=[_fetch_step(0, 2023), growth])
+        edgar = FakeEdgarClient({"AAPL:2023:None": _make_income_data(2023)})
+
+        results = await ExecutionPlanExecutor(edgar).execute(plan)
+
+        assert results[0]["success"] is True
+        assert results[1]["success"] is False
+        assert "Invalid step reference" in results[1]["error"]
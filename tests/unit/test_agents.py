@@ -0,0 +1,171 @@
+"""Tests for the summarizer agent's batched and streamed summaries (fake OpenAI client)."""
+
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from sec_llm.agents import SummarizerAgentImpl
+from sec_llm.models import (
+    ClarifiedQuery,
+    FiscalPeriod,
+    LLMError,
+    MetricName,
+    QueryType,
+    SummaryBatch,
+    SummaryItem,
+)
+
+
+class FakeOpenAI:
+    """Stands in for AsyncOpenAI; answers batches with one summary per item id.
+
+    Batch summaries are returned in reverse id order, so callers must map
+    them back by id. Ids listed in ``drop_ids`` are left out of the reply.
+    """
+
+    def __init__(self, drop_ids: frozenset[int] = frozenset()):
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[int]] = []
+        self._drop_ids = drop_ids
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self._parse))
+        )
+
+    async def _create(self, model, messages, temperature):
+        message = _query_message(messages[-1]["content"])
+        self.single_calls.append(message)
+        return _response(content=f"summary of {message}")
+
+    async def _parse(self, model, messages, response_format, temperature):
+        content = messages[-1]["content"]
+        items = re.findall(r"^\[(\d+)\] Query: (.*)$", content, re.MULTILINE)
+        self.batch_calls.append([int(i) for i, _ in items])
+        summaries = [
+            SummaryItem(id=int(i), summary=f"summary of {message}")
+            for i, message in reversed(items)
+            if int(i) not in self._drop_ids
+        ]
+        return _response(parsed=SummaryBatch(summaries=summaries))
+
+
+def _response(content: str | None = None, parsed: SummaryBatch | None = None):
+    message = SimpleNamespace(content=content, parsed=parsed)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _query_message(content: str) -> str:
+    return re.search(r"^Query: (.*)$", content, re.MULTILINE).group(1)
+
+
+def _item(n: int):
+    query = ClarifiedQuery(
+        ticker="AAPL",
+        query_type=QueryType.direct_retrieval,
+        metrics=[MetricName.revenue],
+        periods=[FiscalPeriod(fiscal_year=2024)],
+        original_message=f"question {n}",
+    )
+    return query, [{"revenue": float(n)}], []
+
+
+class TestSummarizeBatch:
+    async def test_maps_ids_back_to_input_order(self):
+        client = FakeOpenAI()
+        agent = SummarizerAgentImpl(client=client)
+
+        summaries = await agent.summarize_batch([_item(n) for n in range(3)])
+
+        assert summaries == [f"summary of question {n}" for n in range(3)]
+        assert client.batch_calls == [[1, 2, 3]]
+        assert client.single_calls == []
+
+    async def test_large_batch_is_split_into_chunks(self):
+        client = FakeOpenAI()
+        agent = SummarizerAgentImpl(client=client)
+
+        summaries = await agent.summarize_batch([_item(n) for n in range(10)])
+
+        assert summaries == [f"summary of question {n}" for n in range(10)]
+        # 8 items share one call; the remaining 2 go in a second call
+        assert sorted(client.batch_calls, key=len) == [[1, 2], list(range(1, 9))]
+
+    async def test_single_item_uses_plain_completion(self):
+        client = FakeOpenAI()
+        agent = SummarizerAgentImpl(client=client)
+
+        assert await agent.summarize_batch([_item(7)]) == ["summary of question 7"]
+        assert client.single_calls == ["question 7"]
+        assert client.batch_calls == []
+
+    async def test_trailing_single_item_chunk(self):
+        client = FakeOpenAI()
+        agent = SummarizerAgentImpl(client=client)
+
+        summaries = await agent.summarize_batch([_item(n) for n in range(9)])
+
+        assert summaries == [f"summary of question {n}" for n in range(9)]
+        assert client.batch_calls == [list(range(1, 9))]
+        assert client.single_calls == ["question 8"]
+
+    async def test_empty_batch(self):
+        client = FakeOpenAI()
+        agent = SummarizerAgentImpl(client=client)
+
+        assert await agent.summarize_batch([]) == []
+        assert client.batch_calls == []
+        assert client.single_calls == []
+
+    async def test_missing_id_raises(self):
+        agent = SummarizerAgentImpl(client=FakeOpenAI(drop_ids=frozenset({2})))
+
+        with pytest.raises(LLMError, match=r"missing items: \[2\]"):
+            await agent.summarize_batch([_item(n) for n in range(3)])
+
+
+class FakeStream:
+    """Stands in for openai's AsyncStream of chat completion chunks."""
+
+    def __init__(self, deltas: list[str]):
+        self._deltas = deltas
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def __aiter__(self):
+        for delta in self._deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+
+class TestStreamSummarize:
+    async def test_stream_closed_when_consumer_stops_early(self):
+        stream = FakeStream(["Revenue ", "grew ", "7%."])
+
+        async def create(**kwargs):
+            return stream
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        deltas = SummarizerAgentImpl(client=client).stream_summarize(*_item(1))
+
+        assert await anext(deltas) == "Revenue "
+        await deltas.aclose()
+        assert stream.closed
+
+    async def test_stream_closed_when_exhausted(self):
+        stream = FakeStream(["Revenue ", "grew."])
+
+        async def create(**kwargs):
+            return stream
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        deltas = SummarizerAgentImpl(client=client).stream_summarize(*_item(1))
+
+        assert [delta async for delta in deltas] == ["Revenue ", "grew."]
+        assert stream.closed
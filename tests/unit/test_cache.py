@@ -0,0 +1,78 @@
+"""Tests for the in-memory and on-disk SEC caches."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from sec_llm.sec.cache import FileCache, TTLCache
+
+
+class TestTTLCache:
+    def test_roundtrip(self):
+        cache = TTLCache()
+        cache.set("k", 1)
+        assert cache.get("k") == 1
+
+    def test_expired_entry(self):
+        cache = TTLCache(ttl_seconds=-1)
+        cache.set("k", 1)
+        assert cache.get("k") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestFileCache:
+    def test_roundtrip(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.set("income:AAPL:2024:None", {"revenue": 100.0})
+        assert cache.get("income:AAPL:2024:None") == {"revenue": 100.0}
+
+    def test_missing_key(self, tmp_path):
+        assert FileCache(tmp_path).get("income:AAPL:2024:None") is None
+
+    def test_survives_new_instance(self, tmp_path):
+        FileCache(tmp_path).set("k", [1, 2, 3])
+        assert FileCache(tmp_path).get("k") == [1, 2, 3]
+
+    def test_expired_entry(self, tmp_path):
+        cache = FileCache(tmp_path, ttl_seconds=60)
+        cache.set("k", {"a": 1})
+        stale = time.time() - 120
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (stale, stale))
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.set("k", {"a": 1})
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{not json")
+        assert cache.get("k") is None
+
+    def test_clear(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.set("k", {"a": 1})
+        cache.clear()
+        assert cache.get("k") is None
+
+    def test_clear_removes_interrupted_writes(self, tmp_path):
+        (tmp_path / "tmpabc123.tmp").write_text('{"a": ')
+        FileCache(tmp_path).clear()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        cache = FileCache(tmp_path)
+        with pytest.raises(TypeError):
+            cache.set("k", {"a": object()})
+        assert list(tmp_path.iterdir()) == []
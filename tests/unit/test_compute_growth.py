@@ -83,3 +83,13 @@ class TestComputeGrowth:
                 current_period="Q2 FY2024",
                 previous_period="Q1 FY2024",
             )
+
+    def test_repeated_call_is_memoized(self):
+        kwargs = {
+            "metric_name": "revenue",
+            "current_value": 120.0,
+            "previous_value": 100.0,
+            "current_period": "FY2024",
+            "previous_period": "FY2023",
+        }
+        assert compute_growth(**kwargs) is compute_growth(**kwargs)
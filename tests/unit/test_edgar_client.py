@@ -0,0 +1,134 @@
+"""Tests for EdgarClient's memoized edgartools lookups and disk cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sec_llm.models import FilingMetadata, IncomeStatementData
+from sec_llm.sec import client as client_module
+from sec_llm.sec.cache import FileCache
+from sec_llm.sec.client import EdgarClient
+
+
+class TestEdgarObjectMemo:
+    async def test_concurrent_fetches_share_one_filings_listing(self, monkeypatch):
+        listings = []
+
+        class FakeCompany:
+            def get_filings(self, form: str):
+                listings.append(form)
+                time.sleep(0.02)
+                return [form]
+
+        client = EdgarClient(identity="Test test@example.com")
+        monkeypatch.setattr(client, "_get_company", lambda ticker: FakeCompany())
+
+        results = await asyncio.gather(
+            *(client._run_sync(client._get_filings, "AAPL", "10-Q") for _ in range(4))
+        )
+
+        assert listings == ["10-Q"]
+        assert results == [["10-Q"]] * 4
+        assert client._edgar_loading == {}
+
+    def test_failed_load_releases_its_lock(self):
+        client = EdgarClient(identity="Test test@example.com")
+
+        def load():
+            raise RuntimeError("EDGAR unavailable")
+
+        with pytest.raises(RuntimeError):
+            client._memoized("company:AAPL", load)
+        assert client._edgar_loading == {}
+        assert client._memoized("company:AAPL", lambda: "company") == "company"
+
+
+class TestFilingIndex:
+    def test_built_once_per_listing(self, monkeypatch):
+        fy2024 = SimpleNamespace(filing_date="2024-11-01", period_of_report="2024-09-28")
+        fy2023 = SimpleNamespace(filing_date="2023-11-03", period_of_report="2023-09-30")
+        builds = []
+        index_filings = client_module._index_filings
+
+        def counting_index(filings, quarterly):
+            builds.append(quarterly)
+            return index_filings(filings, quarterly)
+
+        client = EdgarClient(identity="Test test@example.com")
+        monkeypatch.setattr(client, "_get_filings", lambda ticker, form: [fy2024, fy2023])
+        monkeypatch.setattr(client_module, "_index_filings", counting_index)
+
+        assert client._get_filing_index("AAPL", "10-K").get((2023, None)) is fy2023
+        assert client._get_filing_index("aapl", "10-K").get((2024, None)) is fy2024
+        assert builds == [False]
+
+
+class TestEdgarClientDiskCache:
+    async def test_restart_reads_from_disk(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_fetch(ticker: str, fiscal_year: int, quarter: int | None = None):
+            calls.append((ticker, fiscal_year, quarter))
+            return IncomeStatementData(
+                metadata=FilingMetadata(
+                    company="Apple Inc.", ticker=ticker, filing_type="10-K",
+                    fiscal_year=fiscal_year,
+                ),
+                revenue=391_035_000_000.0,
+            )
+
+        monkeypatch.setattr(EdgarClient, "_fetch_income_statement", staticmethod(fake_fetch))
+
+        first = EdgarClient(identity="Test test@example.com", disk_cache_dir=str(tmp_path))
+        await first.get_income_statement("AAPL", 2024)
+
+        second = EdgarClient(identity="Test test@example.com", disk_cache_dir=str(tmp_path))
+        data = await second.get_income_statement("AAPL", 2024)
+
+        assert calls == [("AAPL", 2024, None)]
+        assert data.revenue == 391_035_000_000.0
+        assert data.metadata.ticker == "AAPL"
+
+    async def test_empty_parse_is_not_persisted(self, tmp_path, monkeypatch):
+        def fake_fetch(ticker: str, fiscal_year: int, quarter: int | None = None):
+            return IncomeStatementData(
+                metadata=FilingMetadata(
+                    company="Apple Inc.", ticker=ticker, filing_type="10-K",
+                    fiscal_year=fiscal_year,
+                ),
+            )
+
+        monkeypatch.setattr(EdgarClient, "_fetch_income_statement", staticmethod(fake_fetch))
+
+        client = EdgarClient(identity="Test test@example.com", disk_cache_dir=str(tmp_path))
+        await client.get_income_statement("AAPL", 2024)
+
+        assert FileCache(tmp_path).get("income:AAPL:2024:None") is None
+
+    async def test_invalid_entry_is_refetched_and_overwritten(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_fetch(ticker: str, fiscal_year: int, quarter: int | None = None):
+            calls.append((ticker, fiscal_year, quarter))
+            return IncomeStatementData(
+                metadata=FilingMetadata(
+                    company="Apple Inc.", ticker=ticker, filing_type="10-K",
+                    fiscal_year=fiscal_year,
+                ),
+                revenue=391_035_000_000.0,
+            )
+
+        monkeypatch.setattr(EdgarClient, "_fetch_income_statement", staticmethod(fake_fetch))
+        FileCache(tmp_path).set("income:AAPL:2024:None", {"metadata": {"ticker": "AAPL"}})
+
+        client = EdgarClient(identity="Test test@example.com", disk_cache_dir=str(tmp_path))
+        data = await client.get_income_statement("AAPL", 2024)
+
+        assert calls == [("AAPL", 2024, None)]
+        assert data.revenue == 391_035_000_000.0
+        stored = FileCache(tmp_path).get("income:AAPL:2024:None")
+        assert stored["revenue"] == 391_035_000_000.0
@@ -0,0 +1,56 @@
+"""Tests for matching EDGAR filings to a requested fiscal period."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from sec_llm.sec.client import _index_filings
+
+
+def _match(filings, fiscal_year: int, quarter: int | None):
+    return _index_filings(filings, quarterly=quarter is not None).get((fiscal_year, quarter))
+
+
+def _filing(filing_date: str, period_of_report: str | None = None):
+    return SimpleNamespace(filing_date=filing_date, period_of_report=period_of_report)
+
+
+class TestAnnualMatch:
+    def test_prefers_period_of_report_year(self):
+        # Newest first, as edgartools returns them
+        fy2024 = _filing("2024-11-01", "2024-09-28")
+        fy2023 = _filing("2023-11-03", "2023-09-30")
+        assert _match([fy2024, fy2023], 2023, None) is fy2023
+        assert _match([fy2024, fy2023], 2024, None) is fy2024
+
+    def test_falls_back_to_filing_year(self):
+        filing = _filing("2024-02-20")
+        assert _match([filing], 2023, None) is filing
+        assert _match([filing], 2024, None) is filing
+
+    def test_year_not_yet_filed(self):
+        # The FY2023 10-K is filed in 2024 but must not stand in for FY2024
+        fy2023 = _filing("2024-02-02", "2023-12-31")
+        fy2022 = _filing("2023-02-03", "2022-12-31")
+        assert _match([fy2023, fy2022], 2024, None) is None
+
+    def test_amendment_loses_to_original(self):
+        amended = _filing("2024-06-01", "2023-12-31")
+        original = _filing("2024-02-20", "2023-12-31")
+        assert _match([amended, original], 2023, None) is original
+
+    def test_no_match(self):
+        assert _match([_filing("2019-02-01", "2018-12-31")], 2024, None) is None
+
+
+class TestQuarterlyMatch:
+    def test_matches_period_month(self):
+        q1 = _filing("2024-05-03", "2024-03-30")
+        q2 = _filing("2024-08-02", "2024-06-29")
+        assert _match([q2, q1], 2024, 1) is q1
+        assert _match([q2, q1], 2024, 2) is q2
+
+    def test_skips_unparseable_dates(self):
+        bad = _filing("not-a-date", "2024-03-30")
+        no_period = _filing("2024-05-03")
+        assert _match([bad, no_period], 2024, 1) is None
@@ -6,9 +6,11 @@ from sec_llm.formatter import (
     build_citations,
     build_computations,
     build_raw_data,
+    build_response_bundle,
     format_visualization,
 )
 from sec_llm.models import (
+    AggregationResult,
     FilingMetadata,
     GrowthResult,
     IncomeStatementData,
@@ -110,3 +112,40 @@ class TestBuildComputations:
         comps = build_computations(results)
         assert len(comps) == 1
         assert comps[0]["growth_percentage"] == 20.0
+
+
+class TestBuildResponseBundle:
+    def test_matches_individual_builders(self):
+        growth = GrowthResult(
+            metric_name="revenue",
+            current_value=120.0,
+            previous_value=100.0,
+            current_period="FY2024",
+            previous_period="FY2023",
+            growth_rate=0.2,
+            growth_percentage=20.0,
+            formula="test",
+        )
+        aggregation = AggregationResult(
+            metric_name="revenue",
+            method="sum",
+            periods=["Q1 FY2024", "Q2 FY2024"],
+            values=[10.0, 20.0],
+            result=30.0,
+            formula="10.00 + 20.00 = 30.00",
+        )
+        results = [
+            {"output": _make_income_data(2023, revenue=100.0)},
+            {"output": _make_income_data(2024, revenue=120.0)},
+            {"output": growth},
+            {"output": aggregation},
+            {"success": False, "error": "boom"},
+        ]
+        for query_type in QueryType:
+            bundle = build_response_bundle(query_type, "revenue", results)
+            assert bundle == (
+                format_visualization(query_type, "revenue", results),
+                build_citations(results),
+                build_raw_data(results),
+                build_computations(results),
+            )
@@ -26,6 +26,16 @@ class TestExtractNumbers:
         nums = extract_numbers("Declined -5.2%")
         assert -5.2 in nums
 
+    def test_percentage_read_once_in_text_order(self):
+        nums = extract_numbers("Up 5.2% to $394.33 billion")
+        assert nums == [5.2, 394_330_000_000.0]
+
+    def test_percentage_range(self):
+        assert extract_numbers("Gross margin was 40-45% this year") == [40.0, 45.0]
+
+    def test_percentage_range_with_percent_on_each_end(self):
+        assert extract_numbers("Growth of 10%-12%") == [10.0, 12.0]
+
     def test_no_numbers(self):
         assert extract_numbers("No numbers here") == []
 
@@ -79,3 +89,15 @@ class TestVerifySummary:
         summary = "Value was $100.05"
         unverified = verify_summary(summary, truth, tolerance=0.001)
         assert unverified == []
+
+    def test_matches_nearest_of_many(self):
+        truth = {float(v) for v in range(-50, 1000, 7)} | {0.0, 394_328_000_000.0}
+        summary = "Revenue was $394.33 billion, up 0.0%, with 91 stores and 6 closures"
+        unverified = verify_summary(summary, truth)
+        assert unverified == [91.0]
+
+    def test_range_outside_truth_is_flagged(self):
+        assert verify_summary("Gross margin was 40-45% this year", {46.2}) == [40.0, 45.0]
+
+    def test_summary_without_digits(self):
+        assert verify_summary("Could you clarify which fiscal year?", {100.0}) == []
@@ -146,6 +146,19 @@ class TestIncomeStatementData:
         )
         assert data.period_label == "Q2 FY2024"
 
+    def test_period_label_follows_metadata_changes(self):
+        data = IncomeStatementData(
+            metadata=FilingMetadata(
+                company="Apple", ticker="AAPL", filing_type="10-K", fiscal_year=2023
+            ),
+        )
+        quarterly = data.model_copy(
+            update={"metadata": data.metadata.model_copy(update={"quarter": 2})}
+        )
+        assert quarterly.period_label == "Q2 FY2023"
+        data.metadata.quarter = 3
+        assert data.period_label == "Q3 FY2023"
+
 
 class TestClarificationResponse:
     def test_needs_clarification(self):
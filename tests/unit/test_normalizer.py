@@ -4,32 +4,36 @@ from __future__ import annotations
 
 import pandas as pd
 
-from sec_llm.sec.normalizer import find_row_value, format_period_label
+from sec_llm.sec.normalizer import (
+    LABEL_CANDIDATES,
+    build_label_index,
+    find_indexed_value,
+    find_row_value,
+    find_row_values,
+    format_period_label,
+)
+
+
+def _statement(labels: list[str], values: list[float]) -> pd.DataFrame:
+    """A label-indexed statement frame, built with its index in place."""
+    return pd.DataFrame({"value": values}, index=pd.Index(labels, name="label"))
 
 
 class TestFindRowValue:
     def test_exact_match(self):
-        df = pd.DataFrame(
-            {"label": ["Revenue", "Net Income", "EPS"], "value": [100.0, 25.0, 1.5]}
-        )
-        df = df.set_index("label")
+        df = _statement(["Revenue", "Net Income", "EPS"], [100.0, 25.0, 1.5])
         assert find_row_value(df, ["Revenue"]) == 100.0
 
     def test_case_insensitive(self):
-        df = pd.DataFrame({"label": ["TOTAL REVENUE", "Net Income"], "value": [200.0, 50.0]})
-        df = df.set_index("label")
+        df = _statement(["TOTAL REVENUE", "Net Income"], [200.0, 50.0])
         assert find_row_value(df, ["total revenue"]) == 200.0
 
     def test_partial_match(self):
-        df = pd.DataFrame(
-            {"label": ["Total Net Revenue", "Net Income (Loss)"], "value": [300.0, 75.0]}
-        )
-        df = df.set_index("label")
+        df = _statement(["Total Net Revenue", "Net Income (Loss)"], [300.0, 75.0])
         assert find_row_value(df, ["Net Revenue"]) == 300.0
 
     def test_no_match(self):
-        df = pd.DataFrame({"label": ["Revenue"], "value": [100.0]})
-        df = df.set_index("label")
+        df = _statement(["Revenue"], [100.0])
         assert find_row_value(df, ["Operating Income"]) is None
 
     def test_empty_dataframe(self):
@@ -39,15 +43,49 @@ class TestFindRowValue:
     def test_none_dataframe(self):
         assert find_row_value(None, ["Revenue"]) is None
 
+    def test_no_candidates(self):
+        df = _statement(["Revenue"], [100.0])
+        assert find_row_value(df, []) is None
+
     def test_candidate_priority(self):
         """First matching candidate wins."""
-        df = pd.DataFrame(
-            {"label": ["Net Sales", "Total Revenue"], "value": [150.0, 200.0]}
-        )
-        df = df.set_index("label")
+        df = _statement(["Net Sales", "Total Revenue"], [150.0, 200.0])
         # "Revenue" matches "Total Revenue", "Net Sales" matches "Net Sales"
         assert find_row_value(df, ["Net Sales", "Total Revenue"]) == 150.0
 
+    def test_exact_match_beats_earlier_partial(self):
+        df = _statement(["Cost of Revenue", "Revenue"], [60.0, 100.0])
+        assert find_row_value(df, ["Revenue"]) == 100.0
+        assert find_row_value(df, ["Net Sales", "Revenue"]) == 100.0
+
+
+class TestLabelIndex:
+    def test_reused_across_lookups(self):
+        df = pd.DataFrame({
+            "concept": ["Revenues", "NetIncomeLoss"],
+            "label": ["Total net sales", "Net income"],
+            "value": [391_035.0, 93_736.0],
+        })
+        index = build_label_index(df)
+        assert find_indexed_value(index, LABEL_CANDIDATES["revenue"]) == 391_035.0
+        assert find_indexed_value(index, LABEL_CANDIDATES["net_income"]) == 93_736.0
+        assert find_indexed_value(index, LABEL_CANDIDATES["eps_basic"]) is None
+
+    def test_empty_dataframe(self):
+        assert build_label_index(pd.DataFrame()) is None
+        assert find_indexed_value(None, ["Revenue"]) is None
+
+
+class TestFindRowValues:
+    def test_one_result_per_candidate_list(self):
+        df = _statement(["Net Sales", "Net Income"], [150.0, 30.0])
+        assert find_row_values(
+            df, [LABEL_CANDIDATES["revenue"], [], LABEL_CANDIDATES["net_income"]]
+        ) == [150.0, None, 30.0]
+
+    def test_none_dataframe(self):
+        assert find_row_values(None, [["Revenue"], ["Net Income"]]) == [None, None]
+
 
 class TestFormatPeriodLabel:
     def test_annual(self):
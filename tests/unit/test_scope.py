@@ -0,0 +1,34 @@
+"""Tests for input guardrails: scope enforcement and sanitization."""
+
+from __future__ import annotations
+
+from sec_llm.guardrails import check_scope, sanitize_input
+
+
+class TestCheckScope:
+    def test_in_scope(self):
+        assert check_scope("What was Apple's revenue in FY2024?") is None
+
+    def test_out_of_scope(self):
+        error = check_scope("Show me Apple's balance sheet")
+        assert error is not None
+        assert "'balance sheet'" in error
+
+    def test_case_insensitive(self):
+        error = check_scope("What is MSFT's MARKET CAP?")
+        assert error is not None
+        assert "'market cap'" in error
+
+    def test_substring_match(self):
+        assert check_scope("total liabilities for AAPL") is not None
+
+
+class TestSanitizeInput:
+    def test_strips_control_characters(self):
+        assert sanitize_input("Apple\x00 revenue\x07") == "Apple revenue"
+
+    def test_keeps_newlines_and_tabs(self):
+        assert sanitize_input("line one\n\tline two") == "line one\n\tline two"
+
+    def test_truncates(self):
+        assert sanitize_input("x" * 50, max_length=10) == "x" * 10